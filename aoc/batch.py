@@ -0,0 +1,93 @@
+"""Solve many inputs of one day/part in a process pool, streaming JSONL results.
+
+Usage: python -m aoc.batch DAY PART INPUT... [--jobs N] [--chunksize N]
+
+PART is 1, 2 or "both". Every INPUT is a file, a directory (all of its files)
+or a glob pattern. One JSON object is printed per input as soon as it's solved,
+so results come out in completion order, not in input order.
+"""
+import argparse
+import dataclasses
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+from aoc.run import BOTH_PARTS, Part, discover_parts
+
+
+def expand_inputs(patterns: list[str]) -> list[Path]:
+    paths: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths += sorted(child for child in path.iterdir() if child.is_file())
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths += sorted(Path(match) for match in glob.glob(pattern, recursive=True))
+    return paths
+
+
+def find_part(day: int, part: int) -> Part:
+    for candidate in discover_parts(single_parse=part == BOTH_PARTS):
+        if (candidate.day, candidate.part) == (day, part):
+            return candidate
+    raise ValueError(f"There's no solution for day {day} part {part}")
+
+
+def solve_input(part: Part) -> dict[str, Any]:
+    record: dict[str, Any] = {"input": str(part.input_path)}
+    start = time.perf_counter()
+    try:
+        # a worker imports the module with its first task and keeps it
+        record["answer"] = importlib.import_module(part.module).solve(part.input_path)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def solve_batch(
+    part: Part,
+    input_paths: list[Path],
+    processes: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    processes = processes or os.cpu_count() or 1
+    if chunksize is None:
+        # a few chunks per worker: low IPC overhead, still balanced at the end
+        chunksize = max(1, len(input_paths) // (processes * 4))
+    tasks = [dataclasses.replace(part, input_path=path) for path in input_paths]
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(solve_input, tasks, chunksize)
+
+
+def write_jsonl(records: Iterator[dict[str, Any]], output: TextIO) -> None:
+    for record in records:
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", choices=("1", "2", "both"))
+    parser.add_argument("inputs", nargs="+", help="files, directories or globs")
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes")
+    parser.add_argument("--chunksize", type=int, help="inputs sent per task")
+    args = parser.parse_args(argv)
+
+    part = find_part(args.day, BOTH_PARTS if args.part == "both" else int(args.part))
+    input_paths = expand_inputs(args.inputs)
+    records = solve_batch(part, input_paths, args.jobs, args.chunksize)
+    write_jsonl(records, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
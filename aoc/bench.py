@@ -0,0 +1,386 @@
+"""Benchmark every day/part solution on synthetic inputs of several sizes.
+
+Usage: python -m aoc.bench [--day N] [--sizes BYTES ...] [--min-time SECONDS] [--solvers]
+
+With `--solvers`, each public solver function is timed on its own, on input
+parsed beforehand, so parsing and file I/O stay out of its numbers.
+"""
+import argparse
+import copy
+import dataclasses
+import importlib
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.cache import CACHE_DIR_ENV
+from aoc.generators import generate_input
+from aoc.run import Part, discover_parts
+from aoc.tables import render_table
+
+DEFAULT_SIZES = (1_000, 10_000)
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    day: int
+    part: int
+    size: int
+    runs: int
+    total_time: float
+    solver: str = "solve"
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.runs / self.total_time
+
+    @property
+    def time_per_byte(self) -> float:
+        return self.total_time / self.runs / self.size
+
+
+def bench_part(part: Part, min_time: float = 0.2) -> BenchResult:
+    module = importlib.import_module(part.module)
+    runs, total_time = 0, 0.0
+    while runs == 0 or total_time < min_time:
+        start = time.perf_counter()
+        module.solve(part.input_path)
+        total_time += time.perf_counter() - start
+        runs += 1
+    size = part.input_path.stat().st_size
+    return BenchResult(part.day, part.part, size, runs, total_time)
+
+
+@dataclass(frozen=True)
+class Solver:
+    """A public solver function, and how to parse an input file for it."""
+
+    day: int
+    part: int
+    name: str
+    parse: Callable[[Path], Any]
+    run: Callable[[Any], Any]
+    mutates: bool = False  # gets a fresh copy of the parsed input on every run
+
+
+def discover_solvers() -> list[Solver]:
+    from aoc.inputs import read_lines
+    from test_day01 import test_ex01 as day01_1, test_ex02 as day01_2
+    from test_day02 import test_ex03 as day02_1, test_ex04 as day02_2
+    from test_day03 import test_ex05 as day03_1, test_ex06 as day03_2
+    from test_day04 import test_ex07 as day04_1, test_ex08 as day04_2
+    from test_day05 import test_ex09 as day05_1, test_ex10 as day05_2
+    from test_day06 import test_ex11 as day06_1, test_ex12 as day06_2
+    from test_day07 import test_ex13 as day07_1, test_ex14 as day07_2
+    from test_day08 import test_ex13 as day08_1, test_ex14 as day08_2
+    from test_day09 import test_ex15 as day09_1, test_ex16 as day09_2
+    from test_day10 import test_ex17 as day10_1, test_ex18 as day10_2
+    from test_day11 import test_ex17 as day11_1, test_ex18 as day11_2
+
+    def lines(input_path: Path) -> list[str]:
+        return list(read_lines(input_path))
+
+    def raw_lines(input_path: Path) -> list[bytes]:
+        return list(day03_1.read_raw_lines(input_path))
+
+    def section_pairs(input_path: Path) -> list[tuple[range, range]]:
+        return list(day04_1.parse_section_pairs(input_path.read_bytes()))
+
+    def directory_tree(input_path: Path) -> Any:
+        return day07_1.execute_commands(day07_1.parse_input(input_path))
+
+    def rope_moves(simulator_class: type) -> Callable[[list[Any]], Any]:
+        def run(moves: list[Any]) -> Any:
+            simulator = simulator_class()
+            for direction, steps in moves:
+                simulator.move(direction, steps)
+            return simulator.count_tail_visited_tiles()
+
+        return run
+
+    return [
+        Solver(
+            1,
+            1,
+            "get_most_calories",
+            day01_1.parse_packed_calories,
+            day01_1.get_most_calories,
+        ),
+        Solver(
+            1,
+            2,
+            "get_three_most_calories",
+            day01_1.parse_packed_calories,
+            day01_2.get_three_most_calories,
+        ),
+        Solver(
+            2,
+            1,
+            "get_total_score",
+            lambda path: [day02_1.parse_line(line) for line in read_lines(path)],
+            day02_1.get_total_score,
+        ),
+        Solver(
+            2,
+            1,
+            "score_lines",
+            lambda path: path.read_bytes().splitlines(),
+            lambda raw_lines: day02_1.score_lines(raw_lines, day02_1.LINE_SCORES),
+        ),
+        Solver(
+            2,
+            2,
+            "get_total_score",
+            lambda path: [day02_2.parse_line(line) for line in read_lines(path)],
+            day02_2.get_total_score,
+        ),
+        Solver(
+            2,
+            2,
+            "score_lines",
+            lambda path: path.read_bytes().splitlines(),
+            lambda raw_lines: day02_2.score_lines(raw_lines, day02_2.LINE_SCORES),
+        ),
+        Solver(
+            3, 1, "get_raw_priorities_sum", raw_lines, day03_1.get_raw_priorities_sum
+        ),
+        Solver(
+            3, 2, "get_raw_priorities_sum", raw_lines, day03_2.get_raw_priorities_sum
+        ),
+        Solver(
+            4,
+            1,
+            "is_one_range_fully_contained",
+            section_pairs,
+            lambda pairs: sum(
+                day04_1.is_one_range_fully_contained(*pair) for pair in pairs
+            ),
+        ),
+        Solver(
+            4,
+            2,
+            "are_ranges_overlapping",
+            section_pairs,
+            lambda pairs: sum(day04_2.are_ranges_overlapping(*pair) for pair in pairs),
+        ),
+        Solver(
+            5,
+            1,
+            "get_top_crates_after_instructions",
+            day05_1.parse_input,
+            lambda parsed: day05_1.get_top_crates_after_instructions(*parsed),
+            mutates=True,
+        ),
+        Solver(
+            5,
+            2,
+            "get_top_crates_after_instructions",
+            day05_1.parse_input,
+            lambda parsed: day05_2.get_top_crates_after_instructions(*parsed),
+            mutates=True,
+        ),
+        Solver(
+            6,
+            1,
+            "get_start_of_packet_index",
+            lambda path: lines(path)[0],
+            day06_1.get_start_of_packet_index,
+        ),
+        Solver(
+            6,
+            2,
+            "get_start_of_message_index",
+            lambda path: lines(path)[0],
+            day06_2.get_start_of_message_index,
+        ),
+        Solver(
+            7,
+            1,
+            "execute_commands",
+            day07_1.parse_input,
+            day07_1.execute_commands,
+        ),
+        Solver(
+            7,
+            1,
+            "get_sum_of_sizes_with_max_size",
+            directory_tree,
+            day07_1.get_sum_of_sizes_with_max_size,
+        ),
+        Solver(
+            7,
+            2,
+            "get_directory_to_delete_size",
+            directory_tree,
+            day07_2.get_directory_to_delete_size,
+        ),
+        Solver(
+            8,
+            1,
+            "count_visible_trees",
+            day08_1.parse_input,
+            day08_1.count_visible_trees,
+        ),
+        Solver(
+            8,
+            2,
+            "get_max_scenic_score",
+            day08_1.parse_input,
+            day08_2.get_max_scenic_score,
+        ),
+        Solver(
+            9,
+            1,
+            "RopeSimulator.move",
+            lambda path: [day09_1.parse_line(line) for line in read_lines(path)],
+            rope_moves(day09_1.RopeSimulator),
+        ),
+        Solver(
+            9,
+            2,
+            "RopeSimulator.move",
+            lambda path: [day09_1.parse_line(line) for line in read_lines(path)],
+            rope_moves(day09_2.RopeSimulator),
+        ),
+        Solver(
+            10,
+            1,
+            "get_total_signal_strength",
+            lambda path: [day10_1.parse_line(line) for line in read_lines(path)],
+            lambda program: day10_1.get_total_signal_strength(
+                day10_1.InstructionProcessor(program)
+            ),
+        ),
+        Solver(
+            10,
+            2,
+            "InstructionProcessor.paint",
+            lambda path: [day10_1.parse_line(line) for line in read_lines(path)],
+            lambda program: day10_2.InstructionProcessor(program).paint(),
+        ),
+        Solver(
+            11,
+            1,
+            "get_monkey_business_level",
+            day11_1.parse_input,
+            day11_1.get_monkey_business_level,
+            mutates=True,
+        ),
+        Solver(
+            11,
+            2,
+            "get_monkey_business_level",
+            day11_2.parse_input,
+            lambda monkeys: day11_2.get_monkey_business_level(monkeys, 10000),
+            mutates=True,
+        ),
+    ]
+
+
+def bench_solver(
+    solver: Solver, input_path: Path, min_time: float = 0.2
+) -> BenchResult:
+    parsed = solver.parse(input_path)
+    runs, total_time = 0, 0.0
+    while runs == 0 or total_time < min_time:
+        argument = copy.deepcopy(parsed) if solver.mutates else parsed
+        start = time.perf_counter()
+        solver.run(argument)
+        total_time += time.perf_counter() - start
+        runs += 1
+    size = input_path.stat().st_size
+    return BenchResult(solver.day, solver.part, size, runs, total_time, solver.name)
+
+
+def generated_input(workdir: Path, day: int, size: int, seed: int) -> Path:
+    input_path = workdir / f"day{day:02}_{size}.txt"
+    if not input_path.exists():
+        input_path.write_text(generate_input(day, size, seed))
+    return input_path
+
+
+def run_benchmarks(
+    parts: list[Part],
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    min_time: float = 0.2,
+    seed: int = 0,
+) -> list[BenchResult]:
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for part in parts:
+            for size in sizes:
+                input_path = generated_input(Path(workdir), part.day, size, seed)
+                sized_part = dataclasses.replace(part, input_path=input_path)
+                results.append(bench_part(sized_part, min_time))
+    return results
+
+
+def run_solver_benchmarks(
+    solvers: list[Solver],
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    min_time: float = 0.2,
+    seed: int = 0,
+) -> list[BenchResult]:
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for solver in solvers:
+            for size in sizes:
+                input_path = generated_input(Path(workdir), solver.day, size, seed)
+                results.append(bench_solver(solver, input_path, min_time))
+    return results
+
+
+def format_results(results: list[BenchResult]) -> str:
+    header = (
+        "Day",
+        "Part",
+        "Solver",
+        "Size (bytes)",
+        "Runs",
+        "Ops/sec",
+        "Time/byte (ns)",
+    )
+    rows = [
+        (
+            str(result.day),
+            str(result.part),
+            result.solver,
+            str(result.size),
+            str(result.runs),
+            f"{result.ops_per_sec:.2f}",
+            f"{result.time_per_byte * 1e9:.1f}",
+        )
+        for result in results
+    ]
+    return render_table(header, rows)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--parse-cache", metavar="DIR", help="cache parsed inputs")
+    parser.add_argument(
+        "--solvers", action="store_true", help="time each solver on parsed input"
+    )
+    args = parser.parse_args(argv)
+    if args.parse_cache:
+        os.environ[CACHE_DIR_ENV] = args.parse_cache
+
+    sizes = tuple(args.sizes)
+    if args.solvers:
+        solvers = [s for s in discover_solvers() if not args.day or s.day in args.day]
+        results = run_solver_benchmarks(solvers, sizes, args.min_time, args.seed)
+    else:
+        parts = [p for p in discover_parts() if not args.day or p.day in args.day]
+        results = run_benchmarks(parts, sizes, args.min_time, args.seed)
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Content-addressed on-disk cache of parsed puzzle inputs.
+
+Caching is enabled by pointing `AOC_PARSE_CACHE` at a directory. Entries are
+keyed by the input bytes, the source of the module defining the parser and the
+sources of the shared parsing helpers, so editing a parser or a helper it
+calls invalidates its entries. Once the directory grows past
+`AOC_PARSE_CACHE_MAX_BYTES` (64 MiB by default) the least recently used
+entries are evicted.
+"""
+import os
+from pathlib import Path
+from typing import Callable, NamedTuple, TypeVar
+
+from aoc.inputs import map_input
+
+CACHE_DIR_ENV = "AOC_PARSE_CACHE"
+MAX_BYTES_ENV = "AOC_PARSE_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+T = TypeVar("T")
+
+# shared helpers the parsers call; their sources are part of every key
+PARSING_HELPERS = tuple(
+    Path(__file__).with_name(name) for name in ("grid.py", "inputs.py", "parsing.py")
+)
+
+
+# hashlib, inspect and pickle are imported where they are used: solutions import
+# this module, and most runs never enable the cache
+
+
+def cache_key(parser: Callable[[Path], object], input_path: Path) -> str:
+    import hashlib
+    import inspect
+
+    digest = hashlib.sha256()
+    digest.update(f"{parser.__module__}.{parser.__qualname__}\0".encode())
+    for source in (Path(inspect.getfile(parser)), *PARSING_HELPERS):
+        digest.update(source.read_bytes())
+    with map_input(input_path) as buffer:
+        digest.update(buffer)
+    return digest.hexdigest()
+
+
+class ParseCache(NamedTuple):
+    directory: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def get_or_parse(self, parser: Callable[[Path], T], input_path: Path) -> T:
+        import pickle
+
+        entry = self.directory / f"{cache_key(parser, input_path)}.pickle"
+        try:
+            with open(entry, "rb") as f:
+                parsed: T = pickle.load(f)
+        except Exception:  # missing, truncated or pickled by older code
+            parsed = parser(input_path)
+            self._store(entry, parsed)
+        else:
+            os.utime(entry)  # mark as recently used
+        return parsed
+
+    def evict(self) -> None:
+        entries = []
+        for entry in self.directory.glob("*.pickle"):
+            try:
+                entries.append((entry.stat(), entry))
+            except FileNotFoundError:  # evicted by another process
+                continue
+        entries.sort(key=lambda item: item[0].st_mtime, reverse=True)
+        total_size = 0
+        for stat, entry in entries:
+            total_size += stat.st_size
+            if total_size > self.max_bytes:
+                entry.unlink(missing_ok=True)
+
+    def _store(self, entry: Path, parsed: object) -> None:
+        import pickle
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write aside and rename, so concurrent readers never see half an entry
+        partial = entry.with_suffix(f".{os.getpid()}.partial")
+        with open(partial, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, entry)
+        self.evict()
+
+
+def cached_parse(parser: Callable[[Path], T], input_path: Path) -> T:
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return parser(input_path)
+    max_bytes = int(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+    return ParseCache(Path(cache_dir), max_bytes).get_or_parse(parser, input_path)
@@ -0,0 +1,63 @@
+"""Thin client of the warm solution daemon: prints the answer of one day/part.
+
+Usage: python -m aoc.client DAY PART [INPUT] [--socket PATH] [--time]
+
+Start the daemon first with `python -m aoc.daemon`. This module only imports
+what it needs to talk to it, so each run costs little more than the solve.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+SOCKET_ENV = "AOC_DAEMON_SOCKET"
+DEFAULT_SOCKET = Path(__file__).resolve().parent.parent / ".aoc_daemon.sock"
+
+
+def socket_path() -> Path:
+    return Path(os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET)
+
+
+def request(
+    day: int, part: int | str, input_path: Path | None, path: Path | None = None
+) -> dict[str, Any]:
+    """Ask the daemon to solve `input_path` (the day's input.txt if None)."""
+    message = {
+        "day": day,
+        "part": part,
+        "input": str(input_path.resolve()) if input_path else None,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path or socket_path()))
+        sock.sendall(json.dumps(message).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", choices=("1", "2", "both"))
+    parser.add_argument("input", type=Path, nargs="?", help="default: input.txt")
+    parser.add_argument(
+        "--socket", type=Path, help=f"default: ${SOCKET_ENV} or {DEFAULT_SOCKET}"
+    )
+    parser.add_argument("--time", action="store_true", help="print the solve time")
+    args = parser.parse_args(argv)
+
+    part = args.part if args.part == "both" else int(args.part)
+    response = request(args.day, part, args.input, args.socket)
+    if "error" in response:
+        sys.exit(response["error"])
+    answer = response["answer"]
+    print(*(answer if isinstance(answer, list) else [answer]), sep="\n")
+    if args.time:
+        print(f"solved in {response['seconds'] * 1000:.2f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Estimate how each solution scales with input size, and flag superlinear ones.
+
+Usage: python -m aoc.complexity [--day N] [--min-size BYTES] [--steps N]
+                                [--factor N] [--threshold X] [--output FILE]
+
+Every part runs on a geometric series of generated inputs, and the exponent k
+of time ~ size^k is fitted by least squares on the log-log timings.
+"""
+import argparse
+import itertools
+import json
+import math
+import statistics
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.bench import BenchResult, run_benchmarks
+from aoc.run import Part, discover_parts
+from aoc.tables import render_table
+
+DEFAULT_THRESHOLD = 1.2
+
+
+@dataclass(frozen=True)
+class ScalingEstimate:
+    day: int
+    part: int
+    sizes: list[int]
+    seconds: list[float]
+    exponent: float
+    superlinear: bool
+
+
+def fit_exponent(sizes: list[int], seconds: list[float]) -> float:
+    slope, _ = statistics.linear_regression(
+        [math.log(size) for size in sizes], [math.log(time) for time in seconds]
+    )
+    return slope
+
+
+def geometric_sizes(min_size: int, steps: int, factor: int) -> tuple[int, ...]:
+    return tuple(min_size * factor**step for step in range(steps))
+
+
+def estimate_scaling(
+    parts: list[Part],
+    sizes: tuple[int, ...],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_time: float = 0.1,
+) -> list[ScalingEstimate]:
+    estimates = []
+    results = run_benchmarks(parts, sizes, min_time)
+    for (day, part), group in itertools.groupby(
+        results, key=lambda result: (result.day, result.part)
+    ):
+        part_results: list[BenchResult] = list(group)
+        actual_sizes = [result.size for result in part_results]
+        seconds = [result.total_time / result.runs for result in part_results]
+        exponent = fit_exponent(actual_sizes, seconds)
+        estimates.append(
+            ScalingEstimate(
+                day,
+                part,
+                actual_sizes,
+                seconds,
+                round(exponent, 2),
+                exponent > threshold,
+            )
+        )
+    return estimates
+
+
+def format_estimates(estimates: list[ScalingEstimate]) -> str:
+    header = ("Day", "Part", "Sizes (bytes)", "Exponent", "Scaling")
+    rows = [
+        (
+            str(estimate.day),
+            str(estimate.part),
+            f"{estimate.sizes[0]}..{estimate.sizes[-1]}",
+            f"{estimate.exponent:.2f}",
+            "SUPERLINEAR" if estimate.superlinear else "ok",
+        )
+        for estimate in estimates
+    ]
+    return render_table(header, rows)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument("--min-size", type=int, default=500)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--factor", type=int, default=2)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--output", "-o", type=Path, help="write a JSON report here")
+    args = parser.parse_args(argv)
+
+    parts = [part for part in discover_parts() if not args.day or part.day in args.day]
+    sizes = geometric_sizes(args.min_size, args.steps, args.factor)
+    estimates = estimate_scaling(parts, sizes, args.threshold)
+    print(format_estimates(estimates))
+    if args.output:
+        report = [asdict(estimate) for estimate in estimates]
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
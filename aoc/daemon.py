@@ -0,0 +1,128 @@
+"""Keep every day/part solution imported and warm, and solve on request.
+
+Usage: python -m aoc.daemon [--socket PATH]
+
+The daemon listens on a Unix socket for JSON lines like
+`{"day": 8, "part": 1, "input": "/abs/input.txt"}` (part can be "both", and
+a null input means the day's input.txt) and answers each with a JSON line,
+as `aoc.batch` does. `python -m aoc.client` is the command line client.
+
+Before solving, the daemon checks the modification times of the solution
+and helper modules, and imports them again if any of them was edited.
+"""
+import argparse
+import dataclasses
+import importlib
+import json
+import os
+import signal
+import socketserver
+import sys
+from pathlib import Path
+from typing import Any
+
+from aoc.batch import solve_input
+from aoc.client import SOCKET_ENV, socket_path
+from aoc.run import BOTH_PARTS, ROOT, Part, discover_parts
+
+# the daemon's own modules are never re-imported
+_DAEMON_MODULES = {
+    "__main__",
+    "aoc",
+    "aoc.batch",
+    "aoc.client",
+    "aoc.daemon",
+    "aoc.run",
+}
+
+
+class WarmSolutions:
+    def __init__(self) -> None:
+        self.parts: dict[tuple[int, int], Part] = {}
+        self.mtimes: dict[str, int] = {}
+        self.load()
+
+    def load(self) -> None:
+        parts = discover_parts() + discover_parts(single_parse=True)
+        self.parts = {(part.day, part.part): part for part in parts}
+        for part in parts:
+            importlib.import_module(part.module)
+        self.mtimes = self._source_mtimes()
+
+    def is_stale(self) -> bool:
+        return self._source_mtimes() != self.mtimes
+
+    def refresh(self) -> None:
+        if self.is_stale():
+            for name in self.mtimes:
+                sys.modules.pop(name, None)
+            self.load()
+
+    def solve(self, day: int, part: int, input_path: Path | None) -> dict[str, Any]:
+        self.refresh()
+        try:
+            solution = self.parts[day, part]
+        except KeyError:
+            return {"error": f"There's no solution for day {day} part {part}"}
+        if input_path is not None:
+            solution = dataclasses.replace(solution, input_path=input_path)
+        return solve_input(solution)
+
+    @staticmethod
+    def _source_mtimes() -> dict[str, int]:
+        mtimes = {}
+        for name, module in list(sys.modules.items()):
+            filename = getattr(module, "__file__", None)
+            if name in _DAEMON_MODULES or not filename:
+                continue
+            path = Path(filename)
+            if path.is_relative_to(ROOT):
+                mtimes[name] = path.stat().st_mtime_ns
+        return mtimes
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolutionDaemon"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                message = json.loads(line)
+                part = BOTH_PARTS if message["part"] == "both" else int(message["part"])
+                input_path = Path(message["input"]) if message.get("input") else None
+                response = self.server.solutions.solve(
+                    int(message["day"]), part, input_path
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                response = {"error": f"Bad request: {e!r}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class SolutionDaemon(socketserver.UnixStreamServer):
+    def __init__(self, path: Path) -> None:
+        self.solutions = WarmSolutions()
+        path.unlink(missing_ok=True)  # left behind by a daemon that was killed
+        super().__init__(str(path), _RequestHandler)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--socket", type=Path, default=socket_path(), help=f"default: ${SOCKET_ENV}"
+    )
+    args = parser.parse_args(argv)
+
+    # `kill` stops the daemon like Ctrl-C, so the socket is removed either way
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with SolutionDaemon(args.socket) as daemon:
+        print(f"solving on {args.socket}", flush=True)
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Deterministic, seeded generators of synthetic puzzle inputs.
+
+Every generator takes an approximate size in bytes and a `random.Random`, and
+returns text in the same format as that day's `input.txt`.
+"""
+import math
+import random
+import string
+from typing import Callable
+
+InputGenerator = Callable[[int, random.Random], str]
+
+
+def _generate_day01(size: int, rng: random.Random) -> str:
+    groups: list[str] = []
+    written = 0
+    while written < size:
+        group = "\n".join(
+            str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15))
+        )
+        groups.append(group)
+        written += len(group) + 2
+    return "\n\n".join(groups) + "\n"
+
+
+def _generate_day02(size: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(max(size // 4, 1))
+    )
+
+
+def _generate_rucksack(
+    pool: list[str], badge: str, rng: random.Random
+) -> tuple[str, str]:
+    # letters from pool never show up in the other rucksacks of the group, so
+    # the badge is the only item shared by the three of them
+    shared = rng.choice([badge, *pool])
+    others = [letter for letter in pool if letter != shared]
+    rng.shuffle(others)
+    left_letters, right_letters = others[: len(others) // 2], others[len(others) // 2 :]
+    length = rng.randint(8, 24)
+    left = [shared] + ([badge] if shared != badge else [])
+    left += rng.choices(left_letters, k=length - len(left))
+    right = [shared] + rng.choices(right_letters, k=length - 1)
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left), "".join(right)
+
+
+def _generate_day03(size: int, rng: random.Random) -> str:
+    lines: list[str] = []
+    written = 0
+    while written < size:
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, pools = letters[0], (letters[1:18], letters[18:35], letters[35:52])
+        for pool in pools:
+            left, right = _generate_rucksack(pool, badge, rng)
+            lines.append(left + right)
+            written += len(left) + len(right) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _generate_day04(size: int, rng: random.Random) -> str:
+    lines: list[str] = []
+    written = 0
+    while written < size:
+        start1, start2 = rng.randint(1, 99), rng.randint(1, 99)
+        end1, end2 = rng.randint(start1, 99), rng.randint(start2, 99)
+        lines.append(f"{start1}-{end1},{start2}-{end2}")
+        written += len(lines[-1]) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _generate_day05(size: int, rng: random.Random) -> str:
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 8))]
+        for _ in range(9)
+    ]
+    rows = []
+    for level in range(max(len(stack) for stack in stacks) - 1, -1, -1):
+        cells = [
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        ]
+        rows.append(" ".join(cells).rstrip())
+    rows.append(" ".join(f" {i} " for i in range(1, len(stacks) + 1)))
+
+    heights = [len(stack) for stack in stacks]
+    moves: list[str] = []
+    written = sum(len(row) + 1 for row in rows)
+    while written < size:
+        # always leave a crate behind, so every stack has a top at the end
+        origin = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        destination = rng.choice([i for i in range(len(heights)) if i != origin])
+        quantity = rng.randint(1, heights[origin] - 1)
+        heights[origin] -= quantity
+        heights[destination] += quantity
+        moves.append(f"move {quantity} from {origin + 1} to {destination + 1}")
+        written += len(moves[-1]) + 1
+    return "\n".join(rows) + "\n\n" + "\n".join(moves) + "\n"
+
+
+def _generate_day06(size: int, rng: random.Random) -> str:
+    # three letters can't form a marker, so the first one is at the very end
+    noise = "".join(rng.choices("abc", k=max(size - 15, 0)))
+    marker = rng.sample(string.ascii_lowercase[3:], 14)
+    return noise + "".join(marker) + "\n"
+
+
+def _generate_day07(size: int, rng: random.Random) -> str:
+    max_depth = 10
+    children: list[list[int]] = [[]]
+    depths = [0]
+    open_folders = [0]  # folders that can still get subfolders
+    for node in range(1, max(size // 80, 1)):
+        parent = rng.choice(open_folders[-50:])
+        children[parent].append(node)
+        children.append([])
+        depths.append(depths[parent] + 1)
+        if depths[node] < max_depth:
+            open_folders.append(node)
+
+    lines = ["$ cd /"]
+
+    def _emit(node: int) -> None:
+        lines.append("$ ls")
+        names = {child: f"d{child}" for child in children[node]}
+        items = [f"dir {name}" for name in names.values()]
+        items += [
+            f"{rng.randint(1000, 300000)} f{i}.{rng.choice(['txt', 'dat', 'log'])}"
+            for i in range(rng.randint(0, 4))
+        ]
+        rng.shuffle(items)
+        lines.extend(items)
+        for child, name in names.items():
+            lines.append(f"$ cd {name}")
+            _emit(child)
+            lines.append("$ cd ..")
+
+    _emit(0)
+    return "\n".join(lines) + "\n"
+
+
+def _generate_day08(size: int, rng: random.Random) -> str:
+    side = max(math.isqrt(size), 2)
+    return "".join(
+        "".join(rng.choices(string.digits, k=side)) + "\n" for _ in range(side)
+    )
+
+
+def _generate_day09(size: int, rng: random.Random) -> str:
+    lines: list[str] = []
+    written = 0
+    while written < size:
+        lines.append(f"{rng.choice('RLUD')} {rng.randint(1, 19)}")
+        written += len(lines[-1]) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _generate_day10(size: int, rng: random.Random) -> str:
+    lines: list[str] = []
+    written = 0
+    while written < size:
+        lines.append("noop" if rng.random() < 0.3 else f"addx {rng.randint(-20, 20)}")
+        written += len(lines[-1]) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _generate_day11(size: int, rng: random.Random) -> str:
+    monkeys = 8  # the parser assumes single digit monkey ids
+    divisors = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], monkeys)
+    operations = ["old * old"] + [
+        f"old {rng.choice('+*')} {rng.randint(1, 9)}" for _ in range(monkeys - 1)
+    ]
+    rng.shuffle(operations)
+    items_per_monkey = max((size - 150 * monkeys) // (4 * monkeys), 1)
+    blocks = []
+    for monkey in range(monkeys):
+        targets = rng.sample([i for i in range(monkeys) if i != monkey], 2)
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(items_per_monkey))
+        blocks.append(
+            f"Monkey {monkey}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operations[monkey]}\n"
+            f"  Test: divisible by {divisors[monkey]}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}\n"
+        )
+    return "\n".join(blocks)
+
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: _generate_day01,
+    2: _generate_day02,
+    3: _generate_day03,
+    4: _generate_day04,
+    5: _generate_day05,
+    6: _generate_day06,
+    7: _generate_day07,
+    8: _generate_day08,
+    9: _generate_day09,
+    10: _generate_day10,
+    11: _generate_day11,
+}
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(f"{day}-{size}-{seed}"))
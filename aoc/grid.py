@@ -0,0 +1,115 @@
+"""Compact 2D grids of small integers (0-255) for the grid puzzles.
+
+Cells are stored row-major in a single `bytearray`, one byte each, so a
+10k x 10k grid takes 100 MB instead of a list of lists of boxed ints. Rows,
+columns and the rays leaving a cell are `memoryview`s over that buffer, so
+scanning them doesn't copy anything.
+"""
+from typing import Iterable, Iterator
+
+from aoc.inputs import Buffer
+
+Cell = tuple[int, int]  # (row, column)
+
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_DIGITS = bytes(range(10))
+
+
+class Grid:
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: bytearray | None = None):
+        if cells is None:
+            cells = bytearray(width * height)
+        elif len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells don't fill a {width}x{height} grid")
+        self.width = width
+        self.height = height
+        self.cells = cells
+
+    @classmethod
+    def from_digits(cls, data: Buffer) -> "Grid":
+        """Grid of the digits in `data`, one row per line (LF or CRLF ended)."""
+        width = data.find(b"\n")
+        if width == -1:
+            width = len(data)
+        if width and data[width - 1 : width] == b"\r":
+            width -= 1
+        cells = bytearray(data).translate(_DIGIT_VALUES, b"\r\n")
+        if cells.translate(None, _DIGITS):
+            raise ValueError("grid cells must be digits")
+        return cls(width, len(cells) // width if width else 0, cells)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        return cls.from_digits("\n".join(lines).encode())
+
+    def __getitem__(self, cell: Cell) -> int:
+        return self.cells[self._index(cell)]
+
+    def __setitem__(self, cell: Cell, value: int) -> None:
+        self.cells[self._index(cell)] = value
+
+    def __contains__(self, cell: Cell) -> bool:
+        row, column = cell
+        return 0 <= row < self.height and 0 <= column < self.width
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (
+            other.width,
+            other.height,
+            other.cells,
+        )
+
+    def __repr__(self) -> str:
+        return f"Grid(width={self.width}, height={self.height})"
+
+    def _index(self, cell: Cell) -> int:
+        if cell not in self:
+            raise IndexError(f"{cell} is out of a {self.width}x{self.height} grid")
+        return cell[0] * self.width + cell[1]
+
+    def row(self, row: int) -> memoryview:
+        return memoryview(self.cells)[row * self.width : (row + 1) * self.width]
+
+    def column(self, column: int) -> memoryview:
+        return memoryview(self.cells)[column :: self.width]
+
+    def rows(self) -> Iterator[memoryview]:
+        return (self.row(row) for row in range(self.height))
+
+    def columns(self) -> Iterator[memoryview]:
+        return (self.column(column) for column in range(self.width))
+
+    def positions(self) -> Iterator[Cell]:
+        return (
+            (row, column) for row in range(self.height) for column in range(self.width)
+        )
+
+    def rays(self, cell: Cell) -> tuple[memoryview, memoryview, memoryview, memoryview]:
+        """Cells from `cell` (excluded) to each edge, nearest first.
+
+        The order is right, left, down, up.
+        """
+        row, column = cell
+        row_view, column_view = self.row(row), self.column(column)
+        return (
+            row_view[column + 1 :],
+            row_view[:column][::-1],
+            column_view[row + 1 :],
+            column_view[:row][::-1],
+        )
+
+    def neighbors(self, cell: Cell) -> Iterator[Cell]:
+        """Orthogonal neighbors of `cell` that are inside the grid."""
+        row, column = cell
+        for neighbor in (
+            (row, column + 1),
+            (row, column - 1),
+            (row + 1, column),
+            (row - 1, column),
+        ):
+            if neighbor in self:
+                yield neighbor
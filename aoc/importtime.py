@@ -0,0 +1,145 @@
+"""Report how long each day/part solution takes to import, from `-X importtime`.
+
+Usage: python -m aoc.importtime [--day N] [--top N] [--repeat N] [--update-baseline]
+
+Each module is imported in a fresh interpreter, so nothing is cached in
+`sys.modules` already, and the best of `--repeat` runs is kept. Anything not
+needed to solve (input generators, the parse cache internals, more_itertools)
+should be imported where it's used, to keep cold starts cheap.
+
+`--update-baseline` records every module's import time in `BASELINE_PATH`,
+which the tests then hold each module to, within `BUDGET_MARGIN`.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.run import ROOT, discover_parts
+from aoc.tables import render_table
+
+# recorded import times are in bare interpreter starts, measured on the same
+# machine at the same time, so a busy or slower machine scales both alike
+BASELINE_PATH = Path(__file__).with_name("importtime_baseline.json")
+BUDGET_MARGIN = 1.5
+
+
+@dataclass(frozen=True)
+class ImportTime:
+    name: str
+    self_time: float
+    cumulative_time: float
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    module: str
+    imports: list[ImportTime]
+
+    @property
+    def total_time(self) -> float:
+        return next(
+            entry.cumulative_time for entry in self.imports if entry.name == self.module
+        )
+
+    def heaviest(self, top: int) -> list[ImportTime]:
+        others = [entry for entry in self.imports if entry.name != self.module]
+        return sorted(others, key=lambda entry: entry.self_time, reverse=True)[:top]
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        imports.append(
+            ImportTime(name.strip(), int(self_time) / 1e6, int(cumulative_time) / 1e6)
+        )
+    return imports
+
+
+def measure_import(module: str, repeat: int = 3) -> ImportReport:
+    reports = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        reports.append(ImportReport(module, parse_importtime(process.stderr)))
+    return min(reports, key=lambda report: report.total_time)
+
+
+def measure_startup(repeat: int = 5) -> float:
+    """Best wall time of starting an interpreter that imports nothing of ours."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, float]:
+    """Import time of each module when the baseline was recorded, in starts."""
+    return json.loads(path.read_text())
+
+
+def record_baseline(
+    modules: list[str], repeat: int = 5, path: Path = BASELINE_PATH
+) -> dict[str, float]:
+    startup_time = measure_startup()
+    baseline = {
+        module: round(measure_import(module, repeat).total_time / startup_time, 2)
+        for module in modules
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+    return baseline
+
+
+def format_reports(reports: list[ImportReport], top: int = 3) -> str:
+    header = ("Module", "Import (ms)", "Slowest imports (self ms)")
+    rows = [
+        (
+            report.module,
+            f"{report.total_time * 1000:.1f}",
+            ", ".join(
+                f"{entry.name} {entry.self_time * 1000:.1f}"
+                for entry in report.heaviest(top)
+            ),
+        )
+        for report in reports
+    ]
+    return render_table(header, rows)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument("--top", type=int, default=3, help="slowest imports to show")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help=f"rewrite {BASELINE_PATH.name}"
+    )
+    args = parser.parse_args(argv)
+
+    if args.update_baseline:
+        parts = discover_parts() + discover_parts(single_parse=True)
+        record_baseline([part.module for part in parts], max(args.repeat, 5))
+        return
+    reports = [
+        measure_import(part.module, args.repeat)
+        for part in discover_parts()
+        if not args.day or part.day in args.day
+    ]
+    print(format_reports(reports, args.top))
+
+
+if __name__ == "__main__":
+    main()
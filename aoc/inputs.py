@@ -0,0 +1,121 @@
+"""Memory-mapped puzzle input reading.
+
+Inputs are mapped instead of read, and lines are handed out one at a time, so
+solvers can stream through files much larger than the memory they use.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+Buffer = bytes | mmap.mmap
+
+
+@contextmanager
+def map_input(path: Path) -> Iterator[Buffer]:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_line_bounds(buffer: Buffer) -> Iterator[tuple[int, int]]:
+    """Yield `(start, end)` offsets of every line, newline excluded."""
+    start, size = 0, len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield start, end
+        start = end + 1
+
+
+def iter_chunk_bounds(
+    buffer: Buffer, start: int = 0, stop: int | None = None
+) -> Iterator[tuple[int, int]]:
+    """Yield `(start, end)` offsets of every group of lines between blank lines.
+
+    `end` excludes the newline of the group's last line, and runs of blank
+    lines count as a single separator. Only `buffer[start:stop]` is scanned.
+    """
+    stop = len(buffer) if stop is None else stop
+    while True:
+        while start < stop and buffer[start] == ord("\n"):
+            start += 1
+        if start >= stop:
+            return
+        end = buffer.find(b"\n\n", start, stop)
+        if end == -1:
+            end = stop - 1 if buffer[stop - 1] == ord("\n") else stop
+        yield start, end
+        start = end + 1
+
+
+def _split_after(buffer: Buffer, separator: bytes, parts: int) -> list[tuple[int, int]]:
+    size = len(buffer)
+    cuts = [0]
+    for part in range(1, parts):
+        found = buffer.find(separator, max(size * part // parts, cuts[-1]))
+        if found == -1:
+            break
+        cuts.append(found + 1)
+    cuts.append(size)
+    return [(start, stop) for start, stop in zip(cuts, cuts[1:]) if start < stop]
+
+
+def split_at_blank_lines(buffer: Buffer, parts: int) -> list[tuple[int, int]]:
+    """Cut `buffer` in up to `parts` ranges of similar size, made of whole groups.
+
+    The ranges are meant for `iter_chunk_bounds`, so several workers can go
+    through the groups of one buffer, each on its own range.
+    """
+    return _split_after(buffer, b"\n\n", parts)
+
+
+def split_at_lines(buffer: Buffer, parts: int) -> list[tuple[int, int]]:
+    """Cut `buffer` in up to `parts` ranges of similar size, made of whole lines."""
+    return _split_after(buffer, b"\n", parts)
+
+
+def iter_line_block_bounds(
+    buffer: Buffer, block_size: int, start: int = 0, stop: int | None = None
+) -> Iterator[tuple[int, int]]:
+    """Yield `(start, end)` offsets of blocks of whole lines of `buffer[start:stop]`.
+
+    Each block ends with the line that reaches `block_size`, or the range's
+    end, and its last newline is included.
+    """
+    stop = len(buffer) if stop is None else stop
+    while start < stop:
+        end = buffer.find(b"\n", min(start + block_size, stop) - 1, stop)
+        end = stop if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+def read_lines(path: Path) -> Iterator[str]:
+    """Lazily yield the lines of `path` without their trailing newline."""
+    with map_input(path) as buffer:
+        for start, end in iter_line_bounds(buffer):
+            yield buffer[start:end].decode()
+
+
+def read_chunks(path: Path) -> Iterator[bytes]:
+    """Lazily yield the blank-line separated groups of lines of `path`."""
+    with map_input(path) as buffer:
+        for start, end in iter_chunk_bounds(buffer):
+            yield buffer[start:end]
+
+
+def read_line_blocks(path: Path, block_size: int = 2**20) -> Iterator[bytes]:
+    """Lazily yield `path` in blocks of whole lines, of at least `block_size` bytes.
+
+    For solvers that handle many lines at once with bytes methods, without
+    holding the whole file.
+    """
+    with map_input(path) as buffer:
+        for start, end in iter_line_block_bounds(buffer, block_size):
+            yield buffer[start:end]
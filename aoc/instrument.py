@@ -0,0 +1,51 @@
+"""Opt-in call counters for solver hot paths.
+
+`@instrument` returns the function untouched unless `AOC_INSTRUMENT` is set
+when it's applied (that is, when the solution module is imported), so the
+decorated solvers pay nothing in normal runs.
+"""
+import functools
+import os
+import time
+from typing import Any, Callable, TypeVar, cast
+
+INSTRUMENT_ENV = "AOC_INSTRUMENT"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class CallStats:
+    __slots__ = ("calls", "total_time", "_depth")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_time = 0.0
+        self._depth = 0
+
+
+call_stats: dict[str, CallStats] = {}
+
+
+def instrument(func: F) -> F:
+    if not os.environ.get(INSTRUMENT_ENV):
+        return func
+    stats = call_stats.setdefault(f"{func.__module__}.{func.__qualname__}", CallStats())
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats.calls += 1
+        stats._depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats._depth -= 1
+            if not stats._depth:  # recursive calls are timed once, at the top
+                stats.total_time += time.perf_counter() - start
+
+    return cast(F, wrapper)
+
+
+def reset_call_stats() -> None:
+    for stats in call_stats.values():
+        stats.calls, stats.total_time = 0, 0.0
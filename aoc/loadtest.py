@@ -0,0 +1,88 @@
+"""Load test a running `aoc.service` with many concurrent clients.
+
+Usage: python -m aoc.loadtest DAY PART [--requests N] [--concurrency N]
+                              [--inputs N] [--size BYTES] [--port PORT]
+
+Requests cycle through `--inputs` different generated inputs, so with fewer
+inputs than requests most of them are coalesced or served from the cache.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+from aoc.generators import generate_input
+from aoc.service import http_request
+from aoc.tables import render_table
+
+
+async def run_load(
+    host: str,
+    port: int,
+    path: str,
+    bodies: list[bytes],
+    requests: int,
+    concurrency: int,
+) -> tuple[list[float], Counter[str], float]:
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(body: bytes) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            status, response = await http_request(host, port, "POST", path, body)
+            latencies.append(time.perf_counter() - start)
+            outcomes[response.get("source", f"HTTP {status}")] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(bodies[i % len(bodies)]) for i in range(requests)))
+    return latencies, outcomes, time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", choices=("1", "2", "both"))
+    parser.add_argument("--requests", "-n", type=int, default=1000)
+    parser.add_argument("--concurrency", "-c", type=int, default=100)
+    parser.add_argument("--inputs", type=int, default=10, help="distinct inputs")
+    parser.add_argument("--size", type=int, default=10_000, help="input bytes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8022)
+    args = parser.parse_args(argv)
+
+    bodies = [
+        generate_input(args.day, args.size, seed).encode()
+        for seed in range(args.inputs)
+    ]
+    latencies, outcomes, elapsed = asyncio.run(
+        run_load(
+            args.host,
+            args.port,
+            f"/solve/{args.day}/{args.part}",
+            bodies,
+            args.requests,
+            args.concurrency,
+        )
+    )
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        render_table(
+            ("Requests/s", "p50 (ms)", "p99 (ms)", "Max (ms)"),
+            [
+                (
+                    f"{len(latencies) / elapsed:.0f}",
+                    f"{quantiles[49] * 1000:.1f}",
+                    f"{quantiles[98] * 1000:.1f}",
+                    f"{max(latencies) * 1000:.1f}",
+                )
+            ],
+        )
+    )
+    print(", ".join(f"{source}: {count}" for source, count in sorted(outcomes.items())))
+
+
+if __name__ == "__main__":
+    main()
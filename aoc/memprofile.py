@@ -0,0 +1,142 @@
+"""Profile the memory of day/part solutions with tracemalloc and report JSON.
+
+Usage: python -m aoc.memprofile [--day N] [--top N] [--output FILE]
+
+tracemalloc only knows about blocks that are alive, so a background thread
+snapshots the traces whenever traced memory reaches a new high. The report
+has the peak, the blocks alive at that moment and the source lines that
+allocated most of them.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.run import ROOT, Part, discover_parts
+
+_SAMPLE_INTERVAL = 0.005
+
+
+@dataclass(frozen=True)
+class LineAllocation:
+    file: str
+    line: int
+    size_bytes: int
+    blocks: int
+
+
+@dataclass(frozen=True)
+class MemoryProfile:
+    day: int
+    part: int
+    module: str
+    peak_bytes: int
+    peak_blocks: int
+    retained_bytes: int
+    top_lines: list[LineAllocation]
+
+
+class _PeakSampler(threading.Thread):
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.peak_size = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+    def run(self) -> None:
+        while not self.stopped.wait(_SAMPLE_INTERVAL):
+            self.sample()
+
+    def sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.peak_size:
+            self.peak_size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def _relative_path(filename: str) -> str:
+    path = Path(filename)
+    return str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else filename
+
+
+def profile_part(part: Part, top: int = 10) -> MemoryProfile:
+    # imported before tracing, so import-time allocations don't count
+    module = importlib.import_module(part.module)
+    sampler = _PeakSampler()
+    tracemalloc.start()
+    sampler.start()
+    try:
+        module.solve(part.input_path)
+        retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        sampler.stopped.set()
+        sampler.join()
+        sampler.sample()  # solutions faster than one interval still get a snapshot
+        tracemalloc.stop()
+
+    top_lines = []
+    peak_blocks = 0
+    if sampler.snapshot is not None:
+        snapshot = sampler.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+            ]
+        )
+        statistics = snapshot.statistics("lineno")
+        peak_blocks = sum(stat.count for stat in statistics)
+        top_lines = [
+            LineAllocation(
+                _relative_path(stat.traceback[0].filename),
+                stat.traceback[0].lineno,
+                stat.size,
+                stat.count,
+            )
+            for stat in statistics[:top]
+        ]
+    return MemoryProfile(
+        part.day,
+        part.part,
+        part.module,
+        peak_bytes,
+        peak_blocks,
+        retained_bytes,
+        top_lines,
+    )
+
+
+def _profile_part_top(args: tuple[Part, int]) -> MemoryProfile:
+    return profile_part(*args)
+
+
+def profile_parts(
+    parts: list[Part], top: int = 10, processes: int | None = None
+) -> list[MemoryProfile]:
+    # one forked worker per part, so profiles don't see each other's leftovers
+    with multiprocessing.Pool(processes, maxtasksperchild=1) as pool:
+        return pool.map(_profile_part_top, [(part, top) for part in parts], 1)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument("--top", type=int, default=10, help="source lines to keep")
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes")
+    parser.add_argument("--output", "-o", type=Path, help="write JSON here")
+    args = parser.parse_args(argv)
+
+    parts = [part for part in discover_parts() if not args.day or part.day in args.day]
+    profiles = profile_parts(parts, args.top, args.jobs)
+    report = json.dumps([asdict(profile) for profile in profiles], indent=2)
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
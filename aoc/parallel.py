@@ -0,0 +1,26 @@
+"""Run a solver's independent tasks, such as byte ranges of one input, in processes.
+
+Tasks should be small (a path and offsets): each worker maps the input
+itself, so only the tasks and their results cross process boundaries.
+"""
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# below this, starting the worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 64 * 2**20
+
+
+def map_in_processes(func: Callable[[T], R], tasks: list[T]) -> Iterable[R]:
+    """`map(func, tasks)`, with a worker process per task.
+
+    A single task, or tasks given inside a daemonic worker (of `aoc.batch` or
+    `aoc.run`, which aren't allowed children of their own) run right here.
+    """
+    import multiprocessing
+
+    if len(tasks) < 2 or multiprocessing.current_process().daemon:
+        return map(func, tasks)
+    with multiprocessing.Pool(len(tasks)) as pool:
+        return pool.map(func, tasks)
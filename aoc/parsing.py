@@ -0,0 +1,93 @@
+"""Bulk extraction of the integers in a puzzle input.
+
+Buffers go through C-level passes (`bytes.translate` and `split`, or a regex
+scan for signed numbers) over blocks of whole lines, instead of a `split` or
+regex call per line, and the numbers come back packed in an `array('q')`:
+8 bytes each, instead of a 28 byte int object plus an 8 byte pointer in a
+list. Only one block's numbers are ever held as int objects.
+"""
+import re
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from aoc.inputs import Buffer, iter_line_block_bounds, map_input
+
+EXTRACT_BLOCK_SIZE = 2**20
+
+_NON_DIGITS_TO_SPACES = bytes(
+    byte if ord("0") <= byte <= ord("9") else ord(" ") for byte in range(256)
+)
+# a minus sign right after a digit is a separator, as in the ranges "2-4,6-8"
+_SIGNED_INT = re.compile(rb"(?<![0-9])-?[0-9]+")
+
+
+def extract_ints(data: Buffer, signed: bool = False) -> array:
+    """All the integers in `data`, in order, whatever separates them.
+
+    Numbers can't span lines, so `data` is extracted in blocks of whole lines.
+    """
+    ints = array("q")
+    for start, end in iter_line_block_bounds(data, EXTRACT_BLOCK_SIZE):
+        block = data[start:end]
+        if signed:
+            ints.extend(map(int, _SIGNED_INT.findall(block)))
+        else:
+            ints.extend(map(int, block.translate(_NON_DIGITS_TO_SPACES).split()))
+    return ints
+
+
+def compile_malformed_line(line: bytes) -> "re.Pattern[bytes]":
+    """Pattern whose `search` finds the first line of a buffer not matching `line`.
+
+    One C-level scan checks the shape of every line, and unlike a `fullmatch`
+    of repeated lines it keeps no state per line.
+    """
+    return re.compile(rb"^(?!(?:%s)\r?$|\Z)" % line, re.MULTILINE)
+
+
+def count_lines(data: bytes) -> int:
+    unterminated_last_line = data[-1:] not in (b"", b"\n")
+    return data.count(b"\n") + unterminated_last_line
+
+
+def read_ints(path: Path, signed: bool = False) -> array:
+    with map_input(path) as buffer:
+        return extract_ints(buffer, signed)
+
+
+class PackedGroups:
+    """Groups of integers (a list of lists) packed in two arrays.
+
+    `values` holds every integer and `ends` where each group stops. Groups are
+    handed out as `memoryview`s over `values`, so anything that iterates a
+    list of lists of ints can consume them without unpacking.
+    """
+
+    __slots__ = ("values", "ends")
+
+    def __init__(self, values: array, ends: array) -> None:
+        self.values = values
+        self.ends = ends
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[Buffer]) -> "PackedGroups":
+        values, ends = array("q"), array("q")
+        for chunk in chunks:
+            values.extend(extract_ints(chunk))
+            ends.append(len(values))
+        return cls(values, ends)
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def __getitem__(self, index: int) -> memoryview:
+        index = range(len(self.ends))[index]  # bounds check, negative indexes
+        start = self.ends[index - 1] if index else 0
+        return memoryview(self.values)[start : self.ends[index]]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        values, start = memoryview(self.values), 0
+        for end in self.ends:
+            yield values[start:end]
+            start = end
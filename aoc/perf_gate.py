@@ -0,0 +1,144 @@
+"""Pytest plugin that fails the run when a solver gets slower than its baseline.
+
+Tests time a solver through the `perf` fixture, which also marks them as `perf`.
+Timings are compared with `perf_baseline.json`, after scaling both sides by a
+fixed calibration workload, so a baseline recorded on a laptop still makes
+sense on a CI runner.
+
+Re-record the baseline with:
+
+    pytest -m perf --perf-record
+"""
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+BASELINE_FILE = "perf_baseline.json"
+
+
+@dataclass
+class PerfGate:
+    baseline_path: Path
+    threshold: float
+    record: bool
+    baseline: dict[str, Any]
+    timings: dict[str, float] = field(default_factory=dict)
+    _calibration: float | None = None
+
+    @property
+    def calibration(self) -> float:
+        if self._calibration is None:
+            self._calibration = _best_time(_calibration_workload, repeat=5)
+        return self._calibration
+
+    def check(self, nodeid: str, elapsed: float) -> None:
+        self.timings[nodeid] = elapsed
+        baseline_elapsed = self.baseline.get("timings", {}).get(nodeid)
+        if self.record or baseline_elapsed is None:
+            return
+        ratio = (elapsed / self.calibration) / (
+            baseline_elapsed / self.baseline["calibration"]
+        )
+        if ratio > self.threshold:
+            pytest.fail(
+                f"{nodeid} took {elapsed * 1000:.2f} ms, {ratio:.2f}x its baseline "
+                f"(threshold {self.threshold}x). If this is expected, re-record "
+                f"with: pytest -m perf --perf-record",
+                pytrace=False,
+            )
+
+    def save(self) -> None:
+        baseline_timings = self.baseline.get("timings", {})
+        old_calibration = self.baseline.get("calibration", self.calibration)
+        # keep entries that weren't re-measured, scaled to the new calibration
+        timings = {
+            nodeid: elapsed * self.calibration / old_calibration
+            for nodeid, elapsed in baseline_timings.items()
+        }
+        timings.update(self.timings)
+        self.baseline = {
+            "calibration": self.calibration,
+            "timings": dict(sorted(timings.items())),
+        }
+        self.baseline_path.write_text(json.dumps(self.baseline, indent=2) + "\n")
+
+
+def _calibration_workload() -> None:
+    sum(i * i for i in range(100_000))
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+_gate_key = pytest.StashKey[PerfGate]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("perf", "performance regression gate")
+    group.addoption(
+        "--perf-record",
+        action="store_true",
+        help="store the measured timings as the new baseline instead of checking",
+    )
+    group.addoption(
+        "--perf-threshold",
+        type=float,
+        default=2.0,
+        help="fail when a solver is this many times slower than its baseline",
+    )
+    group.addoption(
+        "--perf-baseline",
+        default=None,
+        help=f"baseline JSON file (default: {BASELINE_FILE} in the rootdir)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "perf: times a solver and compares it with the stored baseline"
+    )
+    baseline_path = Path(
+        config.getoption("perf_baseline") or config.rootpath / BASELINE_FILE
+    )
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    config.stash[_gate_key] = PerfGate(
+        baseline_path,
+        config.getoption("perf_threshold"),
+        config.getoption("perf_record"),
+        baseline,
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        if "perf" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.perf)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    gate = session.config.stash[_gate_key]
+    if gate.record and gate.timings:
+        gate.save()
+
+
+@pytest.fixture
+def perf(request: pytest.FixtureRequest) -> Callable[..., float]:
+    """Time `func` (best of `repeat` runs) and check it against the baseline."""
+    gate = request.config.stash[_gate_key]
+
+    def _perf(func: Callable[[], Any], repeat: int = 5) -> float:
+        elapsed = _best_time(func, repeat)
+        gate.check(request.node.nodeid, elapsed)
+        return elapsed
+
+    return _perf
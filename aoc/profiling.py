@@ -0,0 +1,121 @@
+"""Profile day/part solutions: hot path counters, cProfile or collapsed stacks.
+
+Usage: python -m aoc.profiling [--day N] [--format FORMAT] [--output DIR]
+
+- counters: calls and cumulative time of the `@instrument` decorated helpers
+- pstats: a cProfile dump per part, for `python -m pstats` or snakeviz
+- collapsed: self time (in microseconds) per call stack, one stack per line,
+  as read by flamegraph.pl, inferno or speedscope
+"""
+import argparse
+import cProfile
+import importlib
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable
+
+from aoc.instrument import INSTRUMENT_ENV, call_stats, reset_call_stats
+from aoc.run import ROOT, Part, discover_parts
+from aoc.tables import render_table
+
+
+class StackCollector:
+    """`sys.setprofile` hook that adds up self time per call stack."""
+
+    def __init__(self) -> None:
+        self.stack: list[str] = []
+        self.self_times: defaultdict[str, float] = defaultdict(float)
+        self._last = time.perf_counter()
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        now = time.perf_counter()
+        if self.stack:
+            self.self_times[";".join(self.stack)] += now - self._last
+        if event == "call":
+            code = frame.f_code
+            filename = Path(code.co_filename)
+            if filename.is_relative_to(ROOT):
+                filename = filename.relative_to(ROOT)
+            self.stack.append(f"{code.co_qualname} ({filename}:{code.co_firstlineno})")
+        elif event == "c_call":
+            self.stack.append(getattr(arg, "__qualname__", repr(arg)))
+        elif self.stack:  # return, c_return or c_exception
+            self.stack.pop()
+        self._last = time.perf_counter()
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {round(seconds * 1e6)}\n"
+            for stack, seconds in sorted(self.self_times.items())
+            if round(seconds * 1e6)
+        )
+
+
+def collect_stacks(func: Callable[[], Any]) -> StackCollector:
+    collector = StackCollector()
+    sys.setprofile(collector)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return collector
+
+
+def format_call_stats() -> str:
+    header = ("Function", "Calls", "Cumulative (ms)", "Per call (us)")
+    rows = [
+        (
+            name,
+            str(stats.calls),
+            f"{stats.total_time * 1000:.1f}",
+            f"{stats.total_time / stats.calls * 1e6:.2f}",
+        )
+        for name, stats in sorted(
+            call_stats.items(), key=lambda item: item[1].total_time, reverse=True
+        )
+        if stats.calls
+    ]
+    return render_table(header, rows)
+
+
+def profile_part(part: Part, output_format: str, output_dir: Path) -> str:
+    """Solve `part` under the chosen profiler and return what to report."""
+    module = importlib.import_module(part.module)
+    name = f"day{part.day:02}_part{part.part}"
+    if output_format == "counters":
+        reset_call_stats()
+        module.solve(part.input_path)
+        return f"Day {part.day} part {part.part}:\n{format_call_stats()}"
+    if output_format == "pstats":
+        profiler = cProfile.Profile()
+        profiler.runcall(module.solve, part.input_path)
+        profiler.dump_stats(output_dir / f"{name}.pstats")
+        return f"wrote {output_dir / f'{name}.pstats'}"
+    collector = collect_stacks(lambda: module.solve(part.input_path))
+    (output_dir / f"{name}.collapsed").write_text(collector.collapsed())
+    return f"wrote {output_dir / f'{name}.collapsed'}"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument(
+        "--format", choices=("counters", "pstats", "collapsed"), default="counters"
+    )
+    parser.add_argument("--output", "-o", type=Path, default=Path("."))
+    args = parser.parse_args(argv)
+
+    # must be set before the solution modules are imported and decorated
+    os.environ[INSTRUMENT_ENV] = "1" if args.format == "counters" else ""
+    args.output.mkdir(parents=True, exist_ok=True)
+    for part in discover_parts():
+        if not args.day or part.day in args.day:
+            print(profile_part(part, args.format, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Run every day/part solution in a process pool and print a timing table.
+
+Usage: python -m aoc.run [--day N] [--jobs N] [--single-parse]
+"""
+import argparse
+import importlib
+import os
+import multiprocessing
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.cache import CACHE_DIR_ENV
+from aoc.tables import render_table
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# ru_maxrss is reported in kilobytes on Linux but in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+BOTH_PARTS = 0  # part number of a day's test_both module, which solves both
+
+Answer = int | str
+
+
+@dataclass(frozen=True)
+class Part:
+    day: int
+    part: int
+    module: str
+    input_path: Path
+
+
+@dataclass(frozen=True)
+class PartResult:
+    part: Part
+    answer: Answer | tuple[Answer, ...]
+    wall_time: float
+    cpu_time: float
+    peak_rss: int
+
+    @property
+    def answers(self) -> tuple[Answer, ...]:
+        return self.answer if isinstance(self.answer, tuple) else (self.answer,)
+
+
+def discover_parts(root: Path = ROOT, single_parse: bool = False) -> list[Part]:
+    parts = []
+    for day_dir in sorted(root.glob("test_day*")):
+        day = int(day_dir.name.removeprefix("test_day"))
+        if single_parse and (day_dir / "test_both.py").exists():
+            module = f"{day_dir.name}.test_both"
+            parts.append(Part(day, BOTH_PARTS, module, day_dir / "input.txt"))
+            continue
+        for part, module_path in enumerate(sorted(day_dir.glob("test_ex*.py")), 1):
+            module = f"{day_dir.name}.{module_path.stem}"
+            parts.append(Part(day, part, module, day_dir / "input.txt"))
+    return parts
+
+
+def run_part(part: Part) -> PartResult:
+    # imported here, so each worker only pays for the modules it runs
+    module = importlib.import_module(part.module)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    answer = module.solve(part.input_path)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+    return PartResult(part, answer, wall_time, cpu_time, peak_rss)
+
+
+def run_parts(parts: list[Part], processes: int | None = None) -> list[PartResult]:
+    # one forked worker per part: no interpreter startup, and a clean peak RSS
+    with multiprocessing.Pool(processes, maxtasksperchild=1) as pool:
+        return pool.map(run_part, parts, chunksize=1)
+
+
+def format_table(results: list[PartResult]) -> str:
+    header = ("Day", "Part", "Answer", "Wall (ms)", "CPU (ms)", "Peak RSS (MiB)")
+    rows = [
+        (
+            str(result.part.day),
+            "1+2" if result.part.part == BOTH_PARTS else str(result.part.part),
+            " / ".join(
+                "(see below)" if "\n" in str(answer) else str(answer)
+                for answer in result.answers
+            ),
+            f"{result.wall_time * 1000:.1f}",
+            f"{result.cpu_time * 1000:.1f}",
+            f"{result.peak_rss / 2**20:.1f}",
+        )
+        for result in results
+    ]
+    lines = [render_table(header, rows)]
+    for result in results:
+        for i, answer in enumerate(result.answers, 1):
+            if "\n" in str(answer):
+                part = i if result.part.part == BOTH_PARTS else result.part.part
+                lines.append(f"\nDay {result.part.day} part {part}:")
+                lines.append(str(answer).strip("\n"))
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=int, action="append", help="only this day")
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes")
+    parser.add_argument("--parse-cache", metavar="DIR", help="cache parsed inputs")
+    parser.add_argument(
+        "--single-parse",
+        action="store_true",
+        help="parse each day once and solve both parts from it",
+    )
+    args = parser.parse_args(argv)
+    if args.parse_cache:
+        os.environ[CACHE_DIR_ENV] = args.parse_cache
+
+    parts = [
+        part
+        for part in discover_parts(single_parse=args.single_parse)
+        if not args.day or part.day in args.day
+    ]
+    print(format_table(run_parts(parts, args.jobs)))
+
+
+if __name__ == "__main__":
+    main()
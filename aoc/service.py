@@ -0,0 +1,229 @@
+"""Serve the solutions over HTTP with asyncio, solving in a process pool.
+
+Usage: python -m aoc.service [--host HOST] [--port PORT] [--jobs N] [--cache-size N]
+
+    POST /solve/DAY/PART   body: the puzzle input; PART is 1, 2 or "both"
+    GET  /stats            counters of solved, coalesced and cached requests
+
+Answers are JSON objects like the records of `aoc.batch`. Requests are keyed
+by day, part and the SHA-256 of the input: one that arrives while the same
+key is being solved waits for that job instead of starting another, and
+finished answers are kept in an LRU cache. The event loop only parses HTTP
+and hashes, so it stays responsive while every worker is busy.
+"""
+import argparse
+import asyncio
+import hashlib
+import importlib
+import json
+import os
+import signal
+import tempfile
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from aoc.run import BOTH_PARTS, Answer, discover_parts
+
+MAX_BODY_BYTES = 64 * 2**20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 422: "Unprocessable"}
+
+Key = tuple[int, int, str]
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _solve_body(module: str, body: bytes) -> Answer | tuple[Answer, ...]:
+    # solutions read a path, so the body goes through a temporary file
+    with tempfile.NamedTemporaryFile(suffix=".txt") as f:
+        f.write(body)
+        f.flush()
+        return importlib.import_module(module).solve(Path(f.name))
+
+
+class SolveService:
+    def __init__(self, executor: Executor, cache_size: int = 1024) -> None:
+        self.executor = executor
+        self.cache_size = cache_size
+        self.parts = {
+            (part.day, part.part): part
+            for part in discover_parts() + discover_parts(single_parse=True)
+        }
+        self.in_flight: dict[Key, asyncio.Future[Any]] = {}
+        self.answers: OrderedDict[Key, Any] = OrderedDict()
+        self.stats: Counter[str] = Counter()
+
+    async def solve(self, day: int, part: int, body: bytes) -> dict[str, Any]:
+        try:
+            solution = self.parts[day, part]
+        except KeyError:
+            raise HttpError(404, f"There's no solution for day {day} part {part}")
+        key = (day, part, hashlib.sha256(body).hexdigest())
+        start = time.perf_counter()
+        if key in self.answers:
+            self.answers.move_to_end(key)
+            self.stats["cached"] += 1
+            return {"answer": self.answers[key], "source": "cache", "seconds": 0.0}
+
+        job = self.in_flight.get(key)
+        if job is None:
+            self.stats["solved"] += 1
+            source = "solved"
+            job = asyncio.get_running_loop().run_in_executor(
+                self.executor, _solve_body, solution.module, body
+            )
+            self.in_flight[key] = job
+            job.add_done_callback(lambda job: self._finish(key, job))
+        else:
+            self.stats["coalesced"] += 1
+            source = "coalesced"
+        try:
+            # shielded: a client hanging up doesn't cancel the job for the others
+            answer = await asyncio.shield(job)
+        except Exception as e:
+            raise HttpError(422, f"{type(e).__name__}: {e}")
+        return {
+            "answer": answer,
+            "source": source,
+            "seconds": time.perf_counter() - start,
+        }
+
+    def _finish(self, key: Key, job: asyncio.Future[Any]) -> None:
+        del self.in_flight[key]
+        if job.cancelled() or job.exception() is not None:
+            return
+        self.answers[key] = job.result()
+        if len(self.answers) > self.cache_size:
+            self.answers.popitem(last=False)
+
+    async def handle(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        match method, path.strip("/").split("/"):
+            case "GET", ["stats"]:
+                return {**self.stats, "in_flight": len(self.in_flight)}
+            case "POST", ["solve", day, part] if day.isdigit() and (
+                part in ("1", "2", "both")
+            ):
+                part_number = BOTH_PARTS if part == "both" else int(part)
+                return await self.solve(int(day), part_number, body)
+        raise HttpError(404, f"No route for {method} {path}")
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while request := await _read_request(reader):
+                method, path, headers, body = request
+                try:
+                    status, response = 200, await self.handle(method, path, body)
+                except HttpError as e:
+                    status, response = e.status, {"error": str(e)}
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except HttpError as e:
+            _write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+        finally:
+            writer.close()
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> tuple[str, str, dict[str, str], bytes] | None:
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line")
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HttpError(400, "Malformed Content-Length")
+    if length < 0:
+        raise HttpError(400, "Malformed Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HttpError(400, f"Inputs are limited to {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length)
+    return method, path, headers, body
+
+
+def _write_response(
+    writer: asyncio.StreamWriter, status: int, response: Any, keep_alive: bool
+) -> None:
+    body = json.dumps(response).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + body
+    )
+
+
+async def http_request(
+    host: str, port: int, method: str, path: str, body: bytes = b""
+) -> tuple[int, Any]:
+    """Minimal client: one request on a fresh connection, returns status and JSON."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        response = await reader.readexactly(int(headers["content-length"]))
+        return int(status_line.split()[1]), json.loads(response)
+    finally:
+        writer.close()
+
+
+async def serve(
+    host: str, port: int, processes: int | None = None, cache_size: int = 1024
+) -> None:
+    with ProcessPoolExecutor(processes) as executor:
+        service = SolveService(executor, cache_size)
+        server = await asyncio.start_server(service.serve_connection, host, port)
+        async with server:
+            print(f"solving on http://{host}:{port}", flush=True)
+            await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8022)
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes")
+    parser.add_argument("--cache-size", type=int, default=1024, help="answers kept")
+    args = parser.parse_args(argv)
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        asyncio.run(
+            serve(args.host, args.port, args.jobs or os.cpu_count(), args.cache_size)
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
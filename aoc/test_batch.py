@@ -0,0 +1,57 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from aoc.batch import expand_inputs, find_part, solve_batch, write_jsonl
+from aoc.generators import generate_input
+from aoc.run import BOTH_PARTS
+from test_day04 import test_ex07
+
+
+def _write_inputs(directory: Path, count: int) -> list[Path]:
+    directory.mkdir()
+    paths = []
+    for seed in range(count):
+        path = directory / f"user{seed}.txt"
+        path.write_text(generate_input(4, 500, seed))
+        paths.append(path)
+    return paths
+
+
+def test_expand_inputs(tmp_path: Path):
+    paths = _write_inputs(tmp_path / "inputs", 3)
+    assert expand_inputs([str(tmp_path / "inputs")]) == paths
+    assert expand_inputs([str(tmp_path / "inputs" / "user[01].txt")]) == paths[:2]
+    assert expand_inputs([str(paths[2])]) == paths[2:]
+
+
+def test_find_part():
+    assert find_part(8, 2).module == "test_day08.test_ex14"
+    assert find_part(8, BOTH_PARTS).module == "test_day08.test_both"
+    with pytest.raises(ValueError):
+        find_part(30, 1)
+
+
+def test_solve_batch(tmp_path: Path):
+    paths = _write_inputs(tmp_path / "inputs", 7)
+    broken_path = tmp_path / "inputs" / "broken.txt"
+    broken_path.write_text("not a section pair\n")
+    records = list(
+        solve_batch(find_part(4, 1), [*paths, broken_path], processes=2, chunksize=2)
+    )
+    answers = {record["input"]: record.get("answer") for record in records}
+    expected: dict[str, int | None] = {
+        str(path): test_ex07.solve(path) for path in paths
+    }
+    expected[str(broken_path)] = None
+    assert answers == expected
+    broken = next(record for record in records if record["input"] == str(broken_path))
+    assert broken["error"].startswith("ValueError")
+
+
+def test_write_jsonl():
+    output = io.StringIO()
+    write_jsonl(iter([{"input": "a.txt", "answer": [1, "B"]}]), output)
+    assert json.loads(output.getvalue()) == {"input": "a.txt", "answer": [1, "B"]}
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from aoc.bench import (
+    BenchResult,
+    discover_solvers,
+    format_results,
+    run_benchmarks,
+    run_solver_benchmarks,
+)
+from aoc.run import discover_parts
+
+
+def test_run_benchmarks():
+    parts = [part for part in discover_parts() if part.day == 4]
+    results = run_benchmarks(parts, sizes=(200, 2000), min_time=0.01)
+    assert [(result.day, result.part) for result in results] == [
+        (4, 1),
+        (4, 1),
+        (4, 2),
+        (4, 2),
+    ]
+    assert results[0].size < results[1].size
+    assert all(result.runs >= 1 and result.ops_per_sec > 0 for result in results)
+
+
+def test_solvers_cover_every_part():
+    solvers = {(solver.day, solver.part) for solver in discover_solvers()}
+    assert solvers == {(part.day, part.part) for part in discover_parts()}
+
+
+def test_solvers_agree_with_solve(tmp_path: Path):
+    import importlib
+
+    from aoc.generators import generate_input
+
+    parts = {(part.day, part.part): part for part in discover_parts()}
+    for solver in discover_solvers():
+        if solver.name == "execute_commands":
+            continue  # builds the tree the other day 7 solvers take
+        input_path = tmp_path / f"day{solver.day:02}.txt"
+        if not input_path.exists():
+            input_path.write_text(generate_input(solver.day, 300))
+        module = importlib.import_module(parts[solver.day, solver.part].module)
+        answer = solver.run(solver.parse(input_path))
+        assert answer == module.solve(input_path), solver
+
+
+def test_run_solver_benchmarks():
+    solvers = [solver for solver in discover_solvers() if solver.day in (5, 8)]
+    results = run_solver_benchmarks(solvers, sizes=(200, 2000), min_time=0.01)
+    assert [(result.day, result.solver) for result in results[::2]] == [
+        (5, "get_top_crates_after_instructions"),
+        (5, "get_top_crates_after_instructions"),
+        (8, "count_visible_trees"),
+        (8, "get_max_scenic_score"),
+    ]
+    assert all(result.runs >= 1 and result.ops_per_sec > 0 for result in results)
+
+
+def test_bench_result_rates():
+    result = BenchResult(day=1, part=1, size=1000, runs=4, total_time=2.0)
+    assert result.ops_per_sec == 2.0
+    assert result.time_per_byte == 0.0005
+    assert format_results([result]).splitlines()[2].split(" | ")[-2:] == [
+        "   2.00",
+        "      500000.0",
+    ]
@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from aoc.cache import CACHE_DIR_ENV, ParseCache, cache_key, cached_parse
+
+parsed_paths: list[Path] = []
+
+
+def _parse_numbers(input_path: Path) -> list[int]:
+    parsed_paths.append(input_path)
+    return [int(line) for line in input_path.read_text().split()]
+
+
+@pytest.fixture
+def input_path(tmp_path: Path) -> Path:
+    parsed_paths.clear()
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1\n2\n3\n")
+    return input_path
+
+
+def test_cached_parse_disabled(input_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+    assert cached_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert cached_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert len(parsed_paths) == 2
+
+
+def test_cached_parse_hit(
+    input_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    assert cached_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert cached_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert len(parsed_paths) == 1
+
+
+def test_cache_key_follows_content(input_path: Path):
+    key = cache_key(_parse_numbers, input_path)
+    input_path.write_text("1\n2\n4\n")
+    assert cache_key(_parse_numbers, input_path) != key
+
+
+def test_cache_key_follows_helpers(
+    input_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    from aoc import cache
+
+    helper = tmp_path / "helper.py"
+    helper.write_text("SEPARATOR = ','\n")
+    monkeypatch.setattr(cache, "PARSING_HELPERS", (helper,))
+    key = cache_key(_parse_numbers, input_path)
+    helper.write_text("SEPARATOR = ';'\n")
+    assert cache_key(_parse_numbers, input_path) != key
+
+
+def test_stale_entry_is_parsed_again(input_path: Path, tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache")
+    cache.directory.mkdir()
+    entry = cache.directory / f"{cache_key(_parse_numbers, input_path)}.pickle"
+    # pickled before the class it refers to was moved
+    entry.write_bytes(b"cno_such_module\nNumbers\n.")
+    assert cache.get_or_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert cache.get_or_parse(_parse_numbers, input_path) == [1, 2, 3]
+    assert len(parsed_paths) == 1
+
+
+def test_cache_evicts_least_recently_used(input_path: Path, tmp_path: Path):
+    cache = ParseCache(tmp_path / "cache", max_bytes=100)
+    cache.get_or_parse(_parse_numbers, input_path)
+    first_entry = next(cache.directory.glob("*.pickle"))
+    os.utime(first_entry, (0, 0))
+
+    other_path = tmp_path / "other.txt"
+    other_path.write_text("4\n5\n")
+    cache.get_or_parse(_parse_numbers, other_path)
+    assert len(list(cache.directory.glob("*.pickle"))) == 2
+
+    cache.evict()
+    assert len(list(cache.directory.glob("*.pickle"))) == 2
+    ParseCache(cache.directory, max_bytes=30).evict()
+    assert not first_entry.exists()
+    assert len(list(cache.directory.glob("*.pickle"))) == 1
@@ -0,0 +1,49 @@
+import pytest
+
+from aoc import complexity
+from aoc.bench import BenchResult
+from aoc.complexity import (
+    ScalingEstimate,
+    estimate_scaling,
+    fit_exponent,
+    format_estimates,
+    geometric_sizes,
+)
+
+
+def test_fit_exponent():
+    sizes = [100, 200, 400, 800]
+    assert fit_exponent(sizes, [size * 1e-6 for size in sizes]) == pytest.approx(1)
+    assert fit_exponent(sizes, [size**2 * 1e-9 for size in sizes]) == pytest.approx(2)
+
+
+def test_geometric_sizes():
+    assert geometric_sizes(500, 4, 2) == (500, 1000, 2000, 4000)
+
+
+def test_estimate_scaling(monkeypatch):
+    def _fake_benchmarks(parts, sizes, min_time):
+        return [
+            BenchResult(day, part, size, 10, 10 * size**exponent * 1e-9)
+            for day, part, exponent in [(8, 1, 1.5), (8, 2, 1.0)]
+            for size in sizes
+        ]
+
+    monkeypatch.setattr(complexity, "run_benchmarks", _fake_benchmarks)
+    estimates = estimate_scaling([], (1000, 2000, 4000))
+    assert [(e.day, e.part, e.exponent, e.superlinear) for e in estimates] == [
+        (8, 1, 1.5, True),
+        (8, 2, 1.0, False),
+    ]
+    assert estimates[0].sizes == [1000, 2000, 4000]
+
+
+def test_format_estimates():
+    estimate = ScalingEstimate(8, 1, [1000, 16000], [0.01, 0.4], 1.33, True)
+    assert format_estimates([estimate]).splitlines()[2].split(" | ") == [
+        "  8",
+        "   1",
+        "  1000..16000",
+        "    1.33",
+        "SUPERLINEAR",
+    ]
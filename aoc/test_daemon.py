@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from aoc.client import request
+from aoc.daemon import WarmSolutions
+from aoc.run import ROOT
+
+
+def test_daemon(tmp_path: Path):
+    socket_path = tmp_path / "daemon.sock"
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8\n")
+    daemon = subprocess.Popen(
+        [sys.executable, "-m", "aoc.daemon", "--socket", str(socket_path)],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            time.sleep(0.05)
+        assert request(4, 1, input_path, socket_path)["answer"] == 2
+        assert request(4, "both", input_path, socket_path)["answer"] == [2, 4]
+        assert request(12, 1, input_path, socket_path) == {
+            "error": "There's no solution for day 12 part 1"
+        }
+        assert "error" in request(4, 1, tmp_path / "missing.txt", socket_path)
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+def test_warm_solutions_notice_edits(tmp_path: Path, monkeypatch):
+    import types
+
+    from aoc import daemon
+
+    # a throwaway tree, so the test never touches the real sources' mtimes
+    source = tmp_path / "warm_helper.py"
+    source.write_text("ANSWER = 42\n")
+    monkeypatch.setattr(daemon, "ROOT", tmp_path)
+    module = types.ModuleType("warm_helper")
+    module.__file__ = str(source)
+    monkeypatch.setitem(sys.modules, "warm_helper", module)
+
+    solutions = WarmSolutions()
+    assert solutions.mtimes == {"warm_helper": source.stat().st_mtime_ns}
+    assert not solutions.is_stale()
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert solutions.is_stale()
@@ -0,0 +1,30 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from aoc.generators import GENERATORS, generate_input
+from aoc.run import discover_parts
+
+
+def test_generate_input_is_deterministic():
+    for day in GENERATORS:
+        assert generate_input(day, 500, seed=1) == generate_input(day, 500, seed=1)
+        assert generate_input(day, 500, seed=1) != generate_input(day, 500, seed=2)
+
+
+def test_generate_input_scales():
+    for day in GENERATORS:
+        assert len(generate_input(day, 20000)) > 5 * len(generate_input(day, 2000))
+
+
+@pytest.mark.parametrize(
+    "part",
+    # 10000 rounds of monkey business are too slow for a unit test
+    [part for part in discover_parts() if (part.day, part.part) != (11, 2)],
+    ids=lambda part: part.module,
+)
+def test_generated_inputs_are_solvable(part, tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(part.day, 1000))
+    assert importlib.import_module(part.module).solve(input_path) is not None
@@ -0,0 +1,72 @@
+import pytest
+
+from aoc.grid import Grid
+
+EXAMPLE = b"30373\n25512\n65332\n33549\n35390\n"
+
+
+def test_from_digits():
+    grid = Grid.from_digits(EXAMPLE)
+    assert (grid.width, grid.height) == (5, 5)
+    assert grid[0, 3] == 7
+    assert grid[3, 4] == 9
+    assert grid == Grid.from_lines(["30373", "25512", "65332", "33549", "35390"])
+    assert Grid.from_digits(b"") == Grid(0, 0)
+
+
+def test_from_digits_with_crlf():
+    grid = Grid.from_digits(b"123\r\n456\r\n")
+    assert (grid.width, grid.height) == (3, 2)
+    assert list(grid.cells) == [1, 2, 3, 4, 5, 6]
+    assert Grid.from_digits(EXAMPLE.replace(b"\n", b"\r\n")) == Grid.from_digits(
+        EXAMPLE
+    )
+
+
+def test_from_digits_rejects_other_bytes():
+    with pytest.raises(ValueError):
+        Grid.from_digits(b"12a\n456\n")
+    with pytest.raises(ValueError):
+        Grid.from_digits(b"123\r456\n")
+
+
+def test_cells_are_one_byte_each():
+    grid = Grid.from_digits(b"1234\n" * 300)
+    assert len(grid.cells) == grid.width * grid.height == 1200
+
+
+def test_views_dont_copy():
+    grid = Grid.from_digits(EXAMPLE)
+    assert list(grid.row(2)) == [6, 5, 3, 3, 2]
+    assert list(grid.column(1)) == [0, 5, 5, 3, 5]
+    column = grid.column(1)
+    grid[4, 1] = 8
+    assert column[4] == 8
+    assert [list(row) for row in grid.rows()][0] == [3, 0, 3, 7, 3]
+    assert len(list(grid.columns())) == 5
+
+
+def test_rays():
+    grid = Grid.from_digits(EXAMPLE)
+    right, left, down, up = grid.rays((3, 2))
+    assert list(right) == [4, 9]
+    assert list(left) == [3, 3]
+    assert list(down) == [3]
+    assert list(up) == [3, 5, 3]
+    assert [len(ray) for ray in grid.rays((0, 0))] == [4, 0, 4, 0]
+
+
+def test_neighbors():
+    grid = Grid(3, 2)
+    assert sorted(grid.neighbors((0, 0))) == [(0, 1), (1, 0)]
+    assert sorted(grid.neighbors((1, 1))) == [(0, 1), (1, 0), (1, 2)]
+
+
+def test_out_of_bounds():
+    grid = Grid(3, 2)
+    assert (1, 2) in grid
+    assert (2, 0) not in grid
+    with pytest.raises(IndexError):
+        grid[0, 3]
+    with pytest.raises(ValueError):
+        Grid(3, 2, bytearray(5))
@@ -0,0 +1,56 @@
+import pytest
+
+from aoc.importtime import (
+    BUDGET_MARGIN,
+    ImportReport,
+    ImportTime,
+    measure_import,
+    measure_startup,
+    load_baseline,
+    parse_importtime,
+)
+from aoc.run import discover_parts
+
+# only needed by tests or by opt-in tooling, never to solve
+DEFERRED_IMPORTS = {"random", "pickle", "hashlib", "more_itertools"}
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _sha512\n"
+        "import time:      2000 |       2120 | random\n"
+    )
+    assert parse_importtime(stderr) == [
+        ImportTime("_sha512", 0.00012, 0.00012),
+        ImportTime("random", 0.002, 0.00212),
+    ]
+
+
+def test_import_report():
+    report = ImportReport(
+        "random",
+        [ImportTime("_sha512", 0.0001, 0.0001), ImportTime("random", 0.002, 0.0021)],
+    )
+    assert report.total_time == 0.0021
+    assert report.heaviest(3) == [ImportTime("_sha512", 0.0001, 0.0001)]
+
+
+@pytest.fixture(scope="module")
+def startup_time() -> float:
+    return measure_startup()
+
+
+@pytest.mark.parametrize(
+    "module",
+    [part.module for part in discover_parts() + discover_parts(single_parse=True)],
+)
+def test_startup_budget(module: str, startup_time: float):
+    report = measure_import(module, repeat=5)
+    assert not DEFERRED_IMPORTS & {entry.name for entry in report.imports}
+    budget = BUDGET_MARGIN * load_baseline()[module] * startup_time
+    assert report.total_time < budget, (
+        f"importing {module} took {report.total_time * 1000:.1f} ms, more than "
+        f"{BUDGET_MARGIN} times its baseline ({budget * 1000:.1f} ms here); "
+        "if that's intended, run python -m aoc.importtime --update-baseline"
+    )
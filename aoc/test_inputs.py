@@ -0,0 +1,95 @@
+from pathlib import Path
+
+from aoc.inputs import (
+    iter_chunk_bounds,
+    iter_line_bounds,
+    map_input,
+    read_chunks,
+    read_line_blocks,
+    read_lines,
+    split_at_blank_lines,
+    split_at_lines,
+)
+
+
+def test_read_lines(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1000\n2000\n\n3000\n")
+    assert list(read_lines(input_path)) == ["1000", "2000", "", "3000"]
+
+
+def test_read_lines_without_trailing_newline(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("A Y\nB X")
+    assert list(read_lines(input_path)) == ["A Y", "B X"]
+
+
+def test_read_lines_empty_file(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("")
+    assert list(read_lines(input_path)) == []
+
+
+def test_iter_line_bounds(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(b"ab\n\ncde\n")
+    with map_input(input_path) as buffer:
+        assert list(iter_line_bounds(buffer)) == [(0, 2), (3, 3), (4, 7)]
+
+
+def test_iter_chunk_bounds():
+    assert list(iter_chunk_bounds(b"a\nb\n\nc\nd\n\ne\nf\ng")) == [
+        (0, 3),
+        (5, 8),
+        (10, 15),
+    ]
+    assert list(iter_chunk_bounds(b"\na\n\n\n\nb\n\n")) == [(1, 2), (6, 7)]
+    assert list(iter_chunk_bounds(b"")) == []
+    assert list(iter_chunk_bounds(b"\n\n")) == []
+
+
+def test_read_chunks(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1000\n2000\n\n3000\n")
+    assert list(read_chunks(input_path)) == [b"1000\n2000", b"3000"]
+
+
+def test_split_at_blank_lines():
+    buffer = b"1\n2\n\n3\n\n\n4\n5\n\n6\n"
+    for parts in range(1, 8):
+        ranges = split_at_blank_lines(buffer, parts)
+        assert len(ranges) <= parts
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(buffer)
+        assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+        groups = [
+            buffer[start:end]
+            for range_start, range_stop in ranges
+            for start, end in iter_chunk_bounds(buffer, range_start, range_stop)
+        ]
+        assert groups == [b"1\n2", b"3", b"4\n5", b"6"]
+    assert split_at_blank_lines(b"", 4) == []
+
+
+def test_read_line_blocks(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(b"A Y\nB X\nC Z\nlonger line\nA X")
+    for block_size in (1, 4, 5, 9, 100):
+        blocks = list(read_line_blocks(input_path, block_size))
+        assert b"".join(blocks) == input_path.read_bytes()
+        assert all(block.endswith(b"\n") for block in blocks[:-1])
+    assert list(read_line_blocks(input_path, 5))[:2] == [
+        b"A Y\nB X\n",
+        b"C Z\nlonger line\n",
+    ]
+    input_path.write_bytes(b"")
+    assert list(read_line_blocks(input_path)) == []
+
+
+def test_split_at_lines():
+    buffer = b"A Y\nB X\nC Z\nlonger line\nA X"
+    for parts in range(1, 8):
+        ranges = split_at_lines(buffer, parts)
+        assert len(ranges) <= parts
+        assert b"".join(buffer[start:stop] for start, stop in ranges) == buffer
+        assert all(buffer[stop - 1] == ord("\n") for _, stop in ranges[:-1])
+    assert split_at_lines(buffer, 2) == [(0, 24), (24, len(buffer))]
@@ -0,0 +1,22 @@
+import pytest
+
+from aoc.instrument import INSTRUMENT_ENV, call_stats, instrument
+
+
+def _countdown(n: int) -> int:
+    return n if n == 0 else _countdown(n - 1)
+
+
+def test_instrument_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(INSTRUMENT_ENV, raising=False)
+    assert instrument(_countdown) is _countdown
+
+
+def test_instrument_enabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(INSTRUMENT_ENV, "1")
+    monkeypatch.setattr(f"{__name__}._countdown", instrument(_countdown))
+    assert _countdown(3) == 0
+    stats = call_stats[f"{__name__}._countdown"]
+    assert stats.calls == 4
+    assert stats.total_time > 0
+    assert stats._depth == 0
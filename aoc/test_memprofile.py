@@ -0,0 +1,30 @@
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+from aoc.generators import generate_input
+from aoc.memprofile import profile_part, profile_parts
+from aoc.run import Part
+
+
+def test_profile_part(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(4, 20000))
+    profile = profile_part(Part(4, 1, "test_day04.test_ex07", input_path), top=3)
+    assert profile.peak_bytes >= profile.retained_bytes
+    assert profile.peak_bytes > 0
+    assert 0 < len(profile.top_lines) <= 3
+    assert any(line.file == "test_day04/test_ex07.py" for line in profile.top_lines)
+    assert json.loads(json.dumps(asdict(profile)))["module"] == "test_day04.test_ex07"
+
+
+def test_profile_parts(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(2, 2000))
+    profiles = profile_parts(
+        [
+            Part(2, 1, "test_day02.test_ex03", input_path),
+            Part(2, 2, "test_day02.test_ex04", input_path),
+        ]
+    )
+    assert [(profile.day, profile.part) for profile in profiles] == [(2, 1), (2, 2)]
@@ -0,0 +1,26 @@
+import os
+from multiprocessing import Pool
+
+from aoc.parallel import map_in_processes
+
+
+def _task_pid(task: int) -> tuple[int, int]:
+    return task, os.getpid()
+
+
+def _nested_pids(tasks: list[int]) -> list[tuple[int, int]]:
+    return list(map_in_processes(_task_pid, tasks))
+
+
+def test_map_in_processes():
+    results = list(map_in_processes(_task_pid, [1, 2, 3]))
+    assert [task for task, _ in results] == [1, 2, 3]
+    assert os.getpid() not in {pid for _, pid in results}
+    assert list(map_in_processes(_task_pid, [4])) == [(4, os.getpid())]
+
+
+def test_map_in_processes_inside_a_pool_worker():
+    with Pool(1) as pool:
+        (results,) = pool.map(_nested_pids, [[1, 2]])
+    worker_pid = results[0][1]
+    assert results == [(1, worker_pid), (2, worker_pid)]
@@ -0,0 +1,64 @@
+from array import array
+from pathlib import Path
+
+from aoc.parsing import (
+    PackedGroups,
+    compile_malformed_line,
+    count_lines,
+    extract_ints,
+    read_ints,
+)
+
+
+def test_extract_ints():
+    assert extract_ints(b"2-4,6-8\n2-8,3-7\n") == array("q", [2, 4, 6, 8, 2, 8, 3, 7])
+    assert extract_ints(b"move 13 from 1 to 9") == array("q", [13, 1, 9])
+    assert extract_ints(b"") == array("q")
+    assert extract_ints(b"x\xb2 5 \xb3\xb9") == array("q", [5])
+
+
+def test_extract_signed_ints():
+    assert extract_ints(b"addx -5\naddx 12\nnoop", signed=True) == array("q", [-5, 12])
+    assert extract_ints(b"2-4,-6--8", signed=True) == array("q", [2, 4, -6, -8])
+    assert extract_ints(b"addx -5") == array("q", [5])
+
+
+def test_compile_malformed_line():
+    pattern = compile_malformed_line(rb"[0-9]+,[0-9]+")
+    assert pattern.search(b"") is None
+    assert pattern.search(b"1,2\n3,4\n") is None
+    assert pattern.search(b"1,2\r\n3,4") is None
+    assert pattern.search(b"1,2,3\n4\n").start() == 0
+    assert pattern.search(b"1,2\n\n3,4\n").start() == 4
+
+
+def test_count_lines():
+    assert count_lines(b"a\n\nb\n") == 3
+    assert count_lines(b"a\nb") == 2
+    assert count_lines(b"") == 0
+
+
+def test_extract_ints_in_blocks(monkeypatch):
+    from aoc import parsing
+
+    monkeypatch.setattr(parsing, "EXTRACT_BLOCK_SIZE", 4)
+    data = b"12 345\n6\n78-9\n10"
+    assert extract_ints(data) == array("q", [12, 345, 6, 78, 9, 10])
+    assert extract_ints(data, signed=True) == array("q", [12, 345, 6, 78, 9, 10])
+    assert extract_ints(b"1\n-2\n", signed=True) == array("q", [1, -2])
+
+
+def test_read_ints(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Starting items: 79, 98\nTest: divisible by 23\n")
+    assert read_ints(input_path) == array("q", [79, 98, 23])
+
+
+def test_packed_groups():
+    groups = PackedGroups.from_chunks([b"1000\n2000", b"4000", b"5000\n6000"])
+    assert groups.values == array("q", [1000, 2000, 4000, 5000, 6000])
+    assert groups.ends == array("q", [2, 3, 5])
+    assert [list(group) for group in groups] == [[1000, 2000], [4000], [5000, 6000]]
+    assert len(groups) == 3
+    assert list(groups[-1]) == [5000, 6000]
+    assert sum(groups[1]) == 4000
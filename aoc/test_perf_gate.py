@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+SOLVER_PERF_TEST = """
+def test_solver_perf(perf):
+    perf(lambda: sum(range(1000)))
+"""
+
+
+def test_perf_record_and_check(pytester: pytest.Pytester):
+    pytester.makepyfile(test_solver=SOLVER_PERF_TEST)
+    result = pytester.runpytest("-p", "aoc.perf_gate", "--perf-record")
+    result.assert_outcomes(passed=1)
+    baseline = json.loads((pytester.path / "perf_baseline.json").read_text())
+    assert list(baseline["timings"]) == ["test_solver.py::test_solver_perf"]
+    assert baseline["calibration"] > 0
+
+    result = pytester.runpytest("-p", "aoc.perf_gate", "-m", "perf")
+    result.assert_outcomes(passed=1)
+
+
+def test_perf_regression_fails(pytester: pytest.Pytester):
+    pytester.makepyfile(test_solver=SOLVER_PERF_TEST)
+    (pytester.path / "perf_baseline.json").write_text(
+        json.dumps(
+            {
+                "calibration": 1.0,
+                "timings": {"test_solver.py::test_solver_perf": 1e-12},
+            }
+        )
+    )
+    result = pytester.runpytest("-p", "aoc.perf_gate", "--perf-threshold", "3")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*x its baseline (threshold 3.0x)*"])
+
+
+def test_perf_without_baseline_passes(pytester: pytest.Pytester):
+    pytester.makepyfile(test_solver=SOLVER_PERF_TEST)
+    result = pytester.runpytest("-p", "aoc.perf_gate")
+    result.assert_outcomes(passed=1)
+    assert not (pytester.path / "perf_baseline.json").exists()
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+from aoc.profiling import collect_stacks
+from aoc.run import ROOT
+
+
+def _leaf() -> int:
+    return sum(range(10000))
+
+
+def _root() -> int:
+    return _leaf() + _leaf()
+
+
+def test_collect_stacks():
+    collapsed = collect_stacks(_root).collapsed()
+    stacks = {}
+    for line in collapsed.splitlines():
+        stack, microseconds = line.rsplit(" ", 1)
+        frames = [frame.split(" (")[0] for frame in stack.split(";")]
+        stacks[";".join(frames)] = int(microseconds)
+    assert stacks.keys() >= {"_root", "_root;_leaf", "_root;_leaf;sum"}
+    assert all(microseconds > 0 for microseconds in stacks.values())
+    assert "(aoc/test_profiling.py:" in collapsed
+
+
+def test_counters_report():
+    output = subprocess.run(
+        [sys.executable, "-m", "aoc.profiling", "--day", "8"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    calls = {
+        cells[0]: int(cells[1])
+        for cells in (line.split(" | ") for line in output.splitlines())
+        if len(cells) == 4 and cells[1].strip().isdigit()
+    }
+    assert calls == {
+        "test_day08.test_ex13.is_tree_visible": 9801,
+        "test_day08.test_ex14.get_scenic_score": 9801,
+    }
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from aoc.run import (
+    BOTH_PARTS,
+    Part,
+    PartResult,
+    discover_parts,
+    format_table,
+    run_parts,
+)
+
+
+def test_discover_parts():
+    parts = discover_parts()
+    assert len(parts) == 22
+    assert parts[0].module == "test_day01.test_ex01"
+    assert (parts[0].day, parts[0].part) == (1, 1)
+    assert parts[0].input_path.name == "input.txt"
+    assert [
+        (part.day, part.part) for part in parts if part.module.startswith("test_day08")
+    ] == [(8, 1), (8, 2)]
+
+
+def test_discover_parts_single_parse():
+    parts = discover_parts(single_parse=True)
+    assert len(parts) == 11
+    assert parts[6] == Part(7, BOTH_PARTS, "test_day07.test_both", parts[6].input_path)
+
+
+def test_run_parts(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("A Y\nB X\nC Z\n")
+    results = run_parts(
+        [
+            Part(2, 1, "test_day02.test_ex03", input_path),
+            Part(2, 2, "test_day02.test_ex04", input_path),
+        ],
+        processes=2,
+    )
+    assert [result.answer for result in results] == [15, 12]
+    assert all(result.wall_time >= 0 and result.peak_rss > 0 for result in results)
+
+
+def test_format_table():
+    part = Part(10, 2, "test_day10.test_ex18", Path("input.txt"))
+    table = format_table([PartResult(part, "\n##..\n#..#", 0.0015, 0.001, 2**20)])
+    lines = table.splitlines()
+    assert lines[0].split(" | ") == [
+        "Day",
+        "Part",
+        "     Answer",
+        "Wall (ms)",
+        "CPU (ms)",
+        "Peak RSS (MiB)",
+    ]
+    assert [cell.strip() for cell in lines[2].split(" | ")] == [
+        "10",
+        "2",
+        "(see below)",
+        "1.5",
+        "1.0",
+        "1.0",
+    ]
+    assert lines[-2:] == ["##..", "#..#"]
+
+
+def test_format_table_both_parts():
+    part = Part(10, BOTH_PARTS, "test_day10.test_both", Path("input.txt"))
+    table = format_table([PartResult(part, (13140, "\n##.."), 0.002, 0.002, 2**20)])
+    lines = table.splitlines()
+    assert [cell.strip() for cell in lines[2].split(" | ")][:3] == [
+        "10",
+        "1+2",
+        "13140 / (see below)",
+    ]
+    assert lines[-2:] == ["Day 10 part 2:", "##.."]
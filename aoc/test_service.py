@@ -0,0 +1,91 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable
+
+from aoc.service import SolveService, http_request
+
+EXAMPLE = b"2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8\n"
+
+
+def _with_service(
+    cache_size: int, client: Callable[[SolveService, int], Awaitable[Any]]
+) -> Any:
+    async def _run() -> Any:
+        with ProcessPoolExecutor(2) as executor:
+            service = SolveService(executor, cache_size)
+            server = await asyncio.start_server(
+                service.serve_connection, "127.0.0.1", 0
+            )
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                return await client(service, port)
+
+    return asyncio.run(_run())
+
+
+def test_identical_requests_are_solved_once():
+    async def _client(service: SolveService, port: int) -> None:
+        responses = await asyncio.gather(
+            *(
+                http_request("127.0.0.1", port, "POST", "/solve/4/both", EXAMPLE)
+                for _ in range(20)
+            )
+        )
+        assert {status for status, _ in responses} == {200}
+        assert all(response["answer"] == [2, 4] for _, response in responses)
+        assert service.stats["solved"] == 1
+        assert service.stats["coalesced"] + service.stats["cached"] == 19
+
+        _, response = await http_request(
+            "127.0.0.1", port, "POST", "/solve/4/both", EXAMPLE
+        )
+        assert response["source"] == "cache"
+        _, stats = await http_request("127.0.0.1", port, "GET", "/stats")
+        assert stats["solved"] == 1 and stats["in_flight"] == 0
+
+    _with_service(16, _client)
+
+
+def test_least_recently_used_answers_are_evicted():
+    async def _client(service: SolveService, port: int) -> list[str]:
+        sources = []
+        for body in (EXAMPLE, EXAMPLE + b"1-1,1-1\n", EXAMPLE):
+            _, response = await http_request(
+                "127.0.0.1", port, "POST", "/solve/4/1", body
+            )
+            sources.append(response["source"])
+        return sources
+
+    assert _with_service(1, _client) == ["solved", "solved", "solved"]
+    assert _with_service(2, _client) == ["solved", "solved", "cache"]
+
+
+def test_errors():
+    async def _client(service: SolveService, port: int) -> list[tuple[int, Any]]:
+        return [
+            await http_request("127.0.0.1", port, "POST", "/solve/12/1", EXAMPLE),
+            await http_request("127.0.0.1", port, "POST", "/solve/4/1", b"1-2\n"),
+            await http_request("127.0.0.1", port, "GET", "/solve/4/1"),
+        ]
+
+    assert _with_service(16, _client) == [
+        (404, {"error": "There's no solution for day 12 part 1"}),
+        (422, {"error": "ValueError: every line must have two ranges, like 2-4,6-8"}),
+        (404, {"error": "No route for GET /solve/4/1"}),
+    ]
+
+
+def test_malformed_content_length():
+    async def _client(service: SolveService, port: int) -> list[bytes]:
+        status_lines = []
+        for length in (b"ten", b"-1"):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"POST /solve/4/1 HTTP/1.1\r\nContent-Length: %s\r\n\r\n" % length
+            )
+            status_lines.append(await reader.readline())
+            assert b"Malformed Content-Length" in await reader.read()
+            writer.close()
+        return status_lines
+
+    assert _with_service(16, _client) == [b"HTTP/1.1 400 Bad Request\r\n"] * 2
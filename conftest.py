@@ -0,0 +1 @@
+pytest_plugins = ["aoc.perf_gate", "pytester"]
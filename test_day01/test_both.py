@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from . import test_ex01, test_ex02
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    # the top 3 starts with the top 1, so one pass of the fastest engine serves both
+    top = test_ex01.top_k_calories_of_file(input_path, 3)
+    return sum(top[:1]), sum(top)
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(1, 2000))
+    assert solve(input_path) == (
+        test_ex01.solve(input_path),
+        test_ex02.solve(input_path),
+    )
+    input_path.write_text("")
+    assert solve(input_path) == (0, 0)
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,17 +1,15 @@
 from pathlib import Path
-from typing import List, Iterable, Generator, Any
-from itertools import takewhile
+from typing import Iterable
 
+from .test_ex01 import top_k_calories, top_k_calories_of_file
 
-def get_three_most_calories(chunks_of_calories: Iterable[List[int]]) -> int:
-    added_calories = [sum(group) for group in chunks_of_calories]
-    return sum(sorted(added_calories, reverse=True)[:3])
 
+def get_three_most_calories(chunks_of_calories: Iterable[Iterable[int]]) -> int:
+    return sum(top_k_calories((sum(group) for group in chunks_of_calories), 3))
 
-def generate_chunks_of_lines(raw_lines: List[Any]) -> Generator[List[Any], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while lines := list(takewhile(lambda line: bool(line), raw_lines_iterator)):
-        yield lines
+
+def solve(input_path: Path) -> int:
+    return sum(top_k_calories_of_file(input_path, 3))
 
 
 def test_get_three_most_calories():
@@ -44,15 +42,5 @@ def test_get_three_most_calories():
     )
 
 
-def test_generate_chunks_of_lines() -> None:
-    assert list(
-        generate_chunks_of_lines(["a", "b", "", "c", "d", "", "e", "f", "g"])
-    ) == [["a", "b"], ["c", "d"], ["e", "f", "g"]]
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-    lines = [int(line) if line else "" for line in raw_lines]
-    chunks_of_calories = generate_chunks_of_lines(lines)
-    print(get_three_most_calories(chunks_of_calories))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -0,0 +1,246 @@
+"""Follow a calorie log that keeps growing and print the top k total as it changes.
+
+Usage: python -m test_day01.test_stream LOG [-k K] [--checkpoint FILE] [--follow]
+
+Lines are consumed as they are appended: the open group's running sum and the
+top k closed groups are all that's kept, so each total costs O(1) instead of
+a pass over the whole log. The log is read in blocks, and with `--checkpoint`
+the state and the offset of the first unread line are saved after each
+block, so a restart resumes there.
+"""
+import argparse
+import heapq
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .test_ex01 import top_k_calories
+
+READ_BLOCK_SIZE = 2**20
+
+
+class CalorieLeaderboard:
+    """Top `k` group sums of a calorie log, updated one appended line at a time."""
+
+    __slots__ = ("k", "offset", "current", "top", "_top_total", "_partial")
+
+    def __init__(
+        self,
+        k: int,
+        offset: int = 0,
+        current: int | None = None,
+        top: list[int] | None = None,
+    ) -> None:
+        self.k = k
+        self.offset = offset  # bytes of the log consumed, always whole lines
+        self.current = current  # sum of the open group, None between groups
+        self.top = top_k_calories(top or (), k)
+        heapq.heapify(self.top)  # min-heap of the top k closed groups
+        self._top_total = sum(self.top)
+        self._partial = b""
+
+    @property
+    def total(self) -> int:
+        """Sum of the top `k` groups so far, the open one included."""
+        if self.current is None:
+            return self._top_total
+        if len(self.top) < self.k:
+            return self._top_total + self.current
+        # the open group takes the place of the smallest of the top k, if larger
+        return self._top_total + max(self.current - self.top[0], 0)
+
+    @property
+    def read_offset(self) -> int:
+        """Offset of the log's next unread byte."""
+        return self.offset + len(self._partial)
+
+    def add_line(self, line: bytes) -> None:
+        if line.strip():
+            self.current = (self.current or 0) + int(line)
+        elif self.current is not None:
+            self._close_group()
+
+    def _close_group(self) -> None:
+        group_sum, self.current = self.current or 0, None
+        if len(self.top) < self.k:
+            heapq.heappush(self.top, group_sum)
+            self._top_total += group_sum
+        elif group_sum > self.top[0]:
+            self._top_total += group_sum - heapq.heapreplace(self.top, group_sum)
+
+    def feed(self, data: bytes) -> None:
+        """Consume appended bytes; a trailing incomplete line waits for the rest."""
+        *lines, self._partial = (self._partial + data).split(b"\n")
+        for line in lines:
+            self.add_line(line)
+            self.offset += len(line) + 1
+
+    def checkpoint(self) -> dict[str, Any]:
+        return {
+            "k": self.k,
+            "offset": self.offset,
+            "current": self.current,
+            "top": sorted(self.top, reverse=True),
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict[str, Any]) -> "CalorieLeaderboard":
+        return cls(
+            checkpoint["k"],
+            checkpoint["offset"],
+            checkpoint["current"],
+            checkpoint["top"],
+        )
+
+
+def save_checkpoint(leaderboard: CalorieLeaderboard, path: Path) -> None:
+    # write aside and rename, so a crash never leaves half a checkpoint
+    partial = path.with_suffix(f".{os.getpid()}.partial")
+    partial.write_text(json.dumps(leaderboard.checkpoint()) + "\n")
+    os.replace(partial, path)
+
+
+def load_leaderboard(k: int, checkpoint_path: Path | None) -> CalorieLeaderboard:
+    if checkpoint_path is None or not checkpoint_path.exists():
+        return CalorieLeaderboard(k)
+    leaderboard = CalorieLeaderboard.from_checkpoint(
+        json.loads(checkpoint_path.read_text())
+    )
+    if leaderboard.k != k:
+        raise ValueError(
+            f"{checkpoint_path} tracks the top {leaderboard.k}, not the top {k}"
+        )
+    return leaderboard
+
+
+def read_appended(
+    leaderboard: CalorieLeaderboard,
+    log_path: Path,
+    checkpoint_path: Path | None = None,
+    block_size: int = READ_BLOCK_SIZE,
+) -> bool:
+    """Feed whatever was appended to the log since the last read, block by block.
+
+    Memory doesn't depend on how much was appended, and the checkpoint, if
+    any, is saved after each block.
+    """
+    appended = False
+    with open(log_path, "rb") as f:
+        f.seek(leaderboard.read_offset)
+        while block := f.read(block_size):
+            leaderboard.feed(block)
+            appended = True
+            if checkpoint_path is not None:
+                save_checkpoint(leaderboard, checkpoint_path)
+    return appended
+
+
+def test_leaderboard_totals():
+    leaderboard = CalorieLeaderboard(3)
+    totals = []
+    log = b"1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000\n"
+    for line in log.split(b"\n"):
+        leaderboard.add_line(line)
+        totals.append(leaderboard.total)
+    assert totals == [
+        1000,
+        3000,
+        6000,
+        6000,
+        10000,
+        10000,
+        15000,
+        21000,
+        21000,
+        24000,
+        32000,
+        41000,
+        41000,
+        45000,
+        45000,
+    ]
+    assert CalorieLeaderboard(1).total == 0
+
+
+def test_leaderboard_feed_matches_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    from . import test_ex01, test_ex02
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(1, 2000))
+    data = input_path.read_bytes()
+    top1, top3 = CalorieLeaderboard(1), CalorieLeaderboard(3)
+    for start in range(0, len(data), 97):  # split lines between reads
+        top1.feed(data[start : start + 97])
+        top3.feed(data[start : start + 97])
+    assert top1.total == test_ex01.solve(input_path)
+    assert top3.total == test_ex02.solve(input_path)
+
+
+def test_leaderboard_resumes_from_checkpoint(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    from . import test_ex02
+
+    log_path, checkpoint_path = tmp_path / "calories.log", tmp_path / "checkpoint"
+    data = generate_input(1, 2000).encode()
+    middle = len(data) // 2 + 3  # likely in the middle of a line
+    log_path.write_bytes(data[:middle])
+    leaderboard = load_leaderboard(3, checkpoint_path)
+    assert read_appended(leaderboard, log_path, checkpoint_path, block_size=100)
+    assert not read_appended(leaderboard, log_path, checkpoint_path)
+
+    log_path.write_bytes(data)
+    resumed = load_leaderboard(3, checkpoint_path)
+    assert resumed.offset <= middle
+    read_appended(resumed, log_path, block_size=100)
+    assert resumed.total == test_ex02.solve(log_path)
+    assert sorted(tmp_path.iterdir()) == [log_path, checkpoint_path]
+
+
+def test_checkpoint_saved_after_each_block(tmp_path: Path, monkeypatch):
+    import sys
+
+    log_path = tmp_path / "calories.log"
+    log_path.write_bytes(b"1000\n2000\n\n4000\n" * 100)
+    saved_offsets = []
+    monkeypatch.setattr(
+        sys.modules[__name__],
+        "save_checkpoint",
+        lambda leaderboard, path: saved_offsets.append(leaderboard.offset),
+    )
+    read_appended(CalorieLeaderboard(3), log_path, tmp_path / "checkpoint", 256)
+    assert len(saved_offsets) == -(-log_path.stat().st_size // 256)
+    assert saved_offsets == sorted(saved_offsets)
+    assert saved_offsets[-1] == log_path.stat().st_size
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", type=Path)
+    parser.add_argument("-k", type=int, default=3, help="groups in the total")
+    parser.add_argument("--checkpoint", type=Path, help="save and resume state here")
+    parser.add_argument("--follow", "-f", action="store_true", help="keep reading")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds")
+    args = parser.parse_args(argv)
+
+    leaderboard = load_leaderboard(args.k, args.checkpoint)
+    last_total = None
+    try:
+        while True:
+            read_appended(leaderboard, args.log, args.checkpoint)
+            if leaderboard.total != last_total:
+                last_total = leaderboard.total
+                print(last_total, flush=True)
+            if not args.follow:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from aoc.parallel import PARALLEL_MIN_BYTES
+
+from . import test_ex03, test_ex04
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    # the second column means something else in each part, but the kinds of line
+    # are the same, so a single counting pass serves both
+    large = input_path.stat().st_size >= PARALLEL_MIN_BYTES
+    tally = test_ex03.tally_guide(input_path, None if large else 1)
+    return (
+        test_ex03.score_tally(tally, test_ex03.LINE_SCORES),
+        test_ex03.score_tally(tally, test_ex04.LINE_SCORES),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(2, 2000))
+    assert solve(input_path) == (
+        test_ex03.solve(input_path),
+        test_ex04.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,7 +1,21 @@
+import os
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Tuple, Iterable
 from enum import StrEnum, auto
 
+from aoc.inputs import (
+    iter_line_block_bounds,
+    map_input,
+    read_line_blocks,
+    read_lines,
+    split_at_lines,
+)
+from aoc.instrument import instrument
+from aoc.parallel import map_in_processes
+
+TALLY_BLOCK_SIZE = 2**20
+
 
 class Hand(StrEnum):
     ROCK = auto()
@@ -32,6 +46,7 @@ def get_total_score(rounds: Iterable[Tuple[Hand, Hand]]):
     return sum(get_round_score(*hands) for hands in rounds)
 
 
+@instrument
 def get_round_score(opponent_hand: Hand, my_hand: Hand) -> int:
     outcome_score = 0
     if opponent_hand == my_hand:
@@ -54,6 +69,130 @@ def parse_line(raw_line: str) -> Tuple[Hand, Hand]:
     return opponent_to_hand[raw_opponent], player_to_hand[raw_player]
 
 
+class RockPaperScissors:
+    """Rock paper scissors with any odd number of shapes, scored by table lookups.
+
+    Shapes are numbered around a cycle (rock, paper, scissors for three; rock,
+    Spock, paper, lizard, scissors for five) and each one beats the half of
+    the others just before it. Scoring is like the puzzle's: the shape's
+    number plus one, plus 0, 3 or 6 for losing, drawing or winning.
+
+    In the second part the player's column is an offset around the cycle
+    from the opponent's shape, from -(shapes // 2) to shapes // 2, so for
+    three shapes X, Y and Z are lose, draw and win.
+
+    Every table is flat, indexed by `opponent * shapes + column`, so scoring
+    a round costs the same whatever the number of shapes.
+    """
+
+    __slots__ = (
+        "shapes",
+        "outcome_scores",
+        "required_shapes",
+        "scores",
+        "result_scores",
+    )
+
+    def __init__(self, shapes: int = 3) -> None:
+        if shapes < 3 or shapes % 2 == 0:
+            raise ValueError(f"The number of shapes should be odd and > 1: {shapes}")
+        half = shapes // 2
+        self.shapes = shapes
+        self.outcome_scores = [
+            3 if mine == opponent else 6 if (mine - opponent) % shapes <= half else 0
+            for opponent in range(shapes)
+            for mine in range(shapes)
+        ]
+        self.required_shapes = [
+            (opponent + offset) % shapes
+            for opponent in range(shapes)
+            for offset in range(-half, half + 1)
+        ]
+        self.scores = [
+            outcome_score + index % shapes + 1
+            for index, outcome_score in enumerate(self.outcome_scores)
+        ]
+        self.result_scores = [
+            self.scores[index - index % shapes + required]
+            for index, required in enumerate(self.required_shapes)
+        ]
+
+    def score_rounds(
+        self, rounds: Iterable[Tuple[int, int]], by_result: bool = False
+    ) -> int:
+        """Total score of `(opponent, column)` rounds, each a pair of numbers."""
+        scores, shapes = self.result_scores if by_result else self.scores, self.shapes
+        return sum(scores[opponent * shapes + column] for opponent, column in rounds)
+
+    def line_scores(
+        self, opponent_codes: bytes, player_codes: bytes, by_result: bool = False
+    ) -> Dict[bytes, int]:
+        """Score of every possible guide line, like b"A Y", for `score_lines`."""
+        raw_lines = (
+            bytes((opponent_code, ord(" "), player_code))
+            for opponent_code in opponent_codes
+            for player_code in player_codes
+        )
+        scores = self.result_scores if by_result else self.scores
+        return dict(zip(raw_lines, scores, strict=True))
+
+
+# a guide line is one of nine, so each one's score is only worked out once
+LINE_SCORES: Dict[bytes, int] = RockPaperScissors(3).line_scores(b"ABC", b"XYZ")
+
+
+@instrument
+def score_lines(raw_lines: Iterable[bytes], line_scores: Dict[bytes, int]) -> int:
+    return sum(map(line_scores.__getitem__, raw_lines))
+
+
+def tally_lines(raw_lines: bytes) -> Counter[bytes]:
+    """How many lines of each kind there are in a block of whole lines."""
+    tally = Counter({kind: raw_lines.count(kind) for kind in LINE_SCORES})
+    lines = raw_lines.count(b"\n")
+    if raw_lines and not raw_lines.endswith(b"\n"):
+        lines += 1
+    if tally.total() != lines:
+        raise ValueError("Every line should be a round, like 'A Y'")
+    return tally
+
+
+def score_tally(tally: Counter[bytes], line_scores: Dict[bytes, int]) -> int:
+    return sum(line_scores[kind] * count for kind, count in tally.items())
+
+
+def _tally_range(task: tuple[Path, int, int]) -> Counter[bytes]:
+    input_path, start, stop = task
+    tally: Counter[bytes] = Counter()
+    with map_input(input_path) as buffer:
+        for block_start, block_end in iter_line_block_bounds(
+            buffer, TALLY_BLOCK_SIZE, start, stop
+        ):
+            tally.update(tally_lines(buffer[block_start:block_end]))
+    return tally
+
+
+def tally_guide(input_path: Path, processes: int | None = 1) -> Counter[bytes]:
+    """`tally_lines` of a whole guide, split between `processes` (None: per CPU).
+
+    Both parts score the same nine kinds of line, so one tally serves both.
+    """
+    with map_input(input_path) as buffer:
+        ranges = split_at_lines(buffer, processes or os.cpu_count() or 1)
+    tally: Counter[bytes] = Counter()
+    tasks = [(input_path, start, stop) for start, stop in ranges]
+    for range_tally in map_in_processes(_tally_range, tasks):
+        tally.update(range_tally)
+    return tally
+
+
+def solve(input_path: Path) -> int:
+    return sum(
+        score_lines(block.splitlines(), LINE_SCORES)
+        for block in read_line_blocks(input_path)
+    )
+
+
 def test_get_total_score():
     assert (
         get_total_score(
@@ -77,7 +216,79 @@ def test_parse_line():
     assert parse_line("A Y") == (Hand.ROCK, Hand.PAPER)
 
 
+def test_score_lines():
+    assert len(LINE_SCORES) == 9
+    assert score_lines([b"A Y", b"B X", b"C Z"], LINE_SCORES) == 15
+
+
+def test_solve_matches_rounds(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(2, 2000))
+    rounds = (parse_line(line) for line in read_lines(input_path))
+    assert solve(input_path) == get_total_score(rounds)
+
+
+def test_tally_lines():
+    import pytest
+
+    tally = tally_lines(b"A Y\nB X\nC Z\nA Y")
+    assert tally == Counter({b"A Y": 2, b"B X": 1, b"C Z": 1})
+    assert score_tally(tally, LINE_SCORES) == 23
+    assert tally_lines(b"") == Counter()
+    with pytest.raises(ValueError):
+        tally_lines(b"A Y\n\nB X\n")
+
+
+def test_tally_guide(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(2, 2000))
+    tally = Counter(input_path.read_bytes().splitlines())
+    assert tally_guide(input_path) == tally
+    assert tally_guide(input_path, processes=3) == tally
+
+
+def test_line_scores_match_the_hands():
+    assert LINE_SCORES == {
+        f"{opponent} {player}".encode(): get_round_score(
+            *parse_line(f"{opponent} {player}")
+        )
+        for opponent in opponent_to_hand
+        for player in player_to_hand
+    }
+
+
+def test_rock_paper_scissors_with_more_shapes():
+    import pytest
+
+    rock, spock, paper, lizard, scissors = range(5)
+    game = RockPaperScissors(5)
+    assert game.outcome_scores[rock * 5 + spock] == 6  # Spock vaporizes rock
+    assert game.outcome_scores[rock * 5 + lizard] == 0  # rock crushes lizard
+    assert game.outcome_scores[paper * 5 + scissors] == 6  # scissors cut paper
+    assert game.outcome_scores[lizard * 5 + paper] == 0  # lizard eats paper
+    for shapes in (3, 5, 7, 9):
+        game = RockPaperScissors(shapes)
+        for opponent in range(shapes):
+            row = game.outcome_scores[opponent * shapes : (opponent + 1) * shapes]
+            assert sorted(row) == [0] * (shapes // 2) + [3] + [6] * (shapes // 2)
+            for offset, required in enumerate(
+                game.required_shapes[opponent * shapes : (opponent + 1) * shapes]
+            ):
+                outcome = game.outcome_scores[opponent * shapes + required]
+                assert outcome == 3 + 3 * (
+                    (offset > shapes // 2) - (offset < shapes // 2)
+                )
+    assert game.score_rounds([(0, 0), (0, 1)]) == 4 + 8
+    assert game.score_rounds([(0, 4), (0, 5)], by_result=True) == 4 + 8
+    with pytest.raises(ValueError):
+        RockPaperScissors(4)
+    with pytest.raises(ValueError):
+        RockPaperScissors(5).line_scores(b"ABC", b"XYZ")
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        rounds = [parse_line(line.rstrip("\n")) for line in f]
-    print(get_total_score(rounds))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -2,6 +2,11 @@ from pathlib import Path
 from typing import Dict, Tuple, Iterable, List
 from enum import StrEnum, auto
 
+from aoc.inputs import read_line_blocks, read_lines
+from aoc.instrument import instrument
+
+from .test_ex03 import RockPaperScissors, score_lines
+
 
 class Hand(StrEnum):
     ROCK = auto()
@@ -38,6 +43,7 @@ def get_total_score(rounds: Iterable[Tuple[Hand, Result]]):
     return sum(get_round_score(*hands) for hands in rounds)
 
 
+@instrument
 def get_round_score(opponent_hand: Hand, result: Result) -> int:
     outcome_score = 0
     if result == result.DRAW:
@@ -64,6 +70,18 @@ def parse_line(raw_line: str) -> Tuple[Hand, Result]:
     return opponent_to_hand[raw_opponent], player_to_result[raw_player]
 
 
+LINE_SCORES: Dict[bytes, int] = RockPaperScissors(3).line_scores(
+    b"ABC", b"XYZ", by_result=True
+)
+
+
+def solve(input_path: Path) -> int:
+    return sum(
+        score_lines(block.splitlines(), LINE_SCORES)
+        for block in read_line_blocks(input_path)
+    )
+
+
 def test_get_total_score():
     assert (
         get_total_score(
@@ -87,7 +105,25 @@ def test_parse_line():
     assert parse_line("A Y") == (Hand.ROCK, Result.DRAW)
 
 
+def test_line_scores():
+    assert LINE_SCORES == {
+        f"{opponent} {player}".encode(): get_round_score(
+            *parse_line(f"{opponent} {player}")
+        )
+        for opponent in opponent_to_hand
+        for player in player_to_result
+    }
+    assert score_lines([b"A Y", b"B X", b"C Z"], LINE_SCORES) == 12
+
+
+def test_solve_matches_rounds(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(2, 2000))
+    rounds = (parse_line(line) for line in read_lines(input_path))
+    assert solve(input_path) == get_total_score(rounds)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        rounds = [parse_line(line.rstrip("\n")) for line in f]
-    print(get_total_score(rounds))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from aoc.inputs import read_line_blocks
+
+from . import test_ex05, test_ex06
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    # one pass over the blocks, each cut to whole groups of three rucksacks so
+    # the badge groups stay aligned; the rest waits for the next block
+    priorities_sum = badges_sum = 0
+    pending: list[bytes] = []
+    for block in read_line_blocks(input_path):
+        ruckpacks = pending + block.splitlines()
+        whole_groups = len(ruckpacks) - len(ruckpacks) % 3
+        ruckpacks, pending = ruckpacks[:whole_groups], ruckpacks[whole_groups:]
+        priorities_sum += test_ex05.get_raw_priorities_sum(ruckpacks)
+        badges_sum += test_ex06.get_raw_priorities_sum(ruckpacks)
+    # an incomplete last group makes part two raise, as it does on its own
+    return (
+        priorities_sum + test_ex05.get_raw_priorities_sum(pending),
+        badges_sum + test_ex06.get_raw_priorities_sum(pending),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(3, 2000))
+    assert solve(input_path) == (
+        test_ex05.solve(input_path),
+        test_ex06.solve(input_path),
+    )
+
+
+def test_groups_span_blocks(tmp_path: Path, monkeypatch):
+    import sys
+
+    from aoc import inputs
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(3, 2000))
+    expected = solve(input_path)
+    monkeypatch.setattr(
+        sys.modules[__name__],
+        "read_line_blocks",
+        lambda path: inputs.read_line_blocks(path, block_size=100),
+    )
+    assert solve(input_path) == expected
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
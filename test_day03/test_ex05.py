@@ -1,10 +1,16 @@
 import string
 
 from pathlib import Path
-from typing import List
+from itertools import chain
+from typing import Iterable, Iterator
 
+from aoc.inputs import read_line_blocks
 
-def get_priorities_sum(ruckpacks: List[str]) -> int:
+# priority of every byte value, 0 for the ones that aren't items
+ITEM_PRIORITIES = bytes(string.ascii_letters.find(chr(byte)) + 1 for byte in range(256))
+
+
+def get_priorities_sum(ruckpacks: Iterable[str]) -> int:
     return sum(get_item_priority(get_shared_item(ruckpack)) for ruckpack in ruckpacks)
 
 
@@ -20,6 +26,40 @@ def get_item_priority(item: str) -> int:
     return string.ascii_letters.index(item) + 1
 
 
+def shared_items(first: bytes, *others: bytes) -> bytes:
+    """Items of `first` that are in every one of `others`, without building sets."""
+    for other in others:
+        # deleting what isn't in `other` leaves what is
+        first = first.translate(None, first.translate(None, other))
+    return first
+
+
+def get_shared_priority(*rucksacks: bytes) -> int:
+    shared = shared_items(*rucksacks)
+    if not shared:
+        raise ValueError(f"Rucksacks {rucksacks} don't share any item")
+    return ITEM_PRIORITIES[shared[0]]
+
+
+def get_raw_priorities_sum(raw_ruckpacks: Iterable[bytes]) -> int:
+    return sum(
+        get_shared_priority(
+            ruckpack[: len(ruckpack) // 2], ruckpack[len(ruckpack) // 2 :]
+        )
+        for ruckpack in raw_ruckpacks
+    )
+
+
+def read_raw_lines(input_path: Path) -> Iterator[bytes]:
+    return chain.from_iterable(
+        block.splitlines() for block in read_line_blocks(input_path)
+    )
+
+
+def solve(input_path: Path) -> int:
+    return get_raw_priorities_sum(read_raw_lines(input_path))
+
+
 def test_get_priorities_sum():
     assert (
         get_priorities_sum(
@@ -47,7 +87,31 @@ def test_get_item_priority():
     assert get_item_priority("t") == 20
 
 
+def test_get_shared_priority():
+    import pytest
+
+    assert get_shared_priority(b"vJrwpWtwJgWr", b"hcsFMMfFFhFp") == 16
+    assert (
+        get_shared_priority(
+            b"vJrwpWtwJgWrhcsFMMfFFhFp",
+            b"jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL",
+            b"PmmdzqPrVvPwwTWBwg",
+        )
+        == 18
+    )
+    assert ITEM_PRIORITIES[ord("P")] == 42 and ITEM_PRIORITIES[ord("\n")] == 0
+    with pytest.raises(ValueError):
+        get_shared_priority(b"abc", b"ABC")
+
+
+def test_solve_matches_sets(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(3, 2000))
+    ruckpacks = input_path.read_text().splitlines()
+    assert solve(input_path) == get_priorities_sum(ruckpacks)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        ruckpacks = [line.rstrip("\n") for line in f]
-    print(get_priorities_sum(ruckpacks))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -3,10 +3,12 @@ import string
 from pathlib import Path
 from typing import Iterable
 
-from more_itertools import grouper
+from .test_ex05 import get_shared_priority, read_raw_lines
 
 
 def get_priorities_sum(ruckpacks: Iterable[str]) -> int:
+    from more_itertools import grouper
+
     return sum(
         get_item_priority(get_shared_item(three_ruckpacks))
         for three_ruckpacks in grouper(ruckpacks, 3)
@@ -22,6 +24,18 @@ def get_item_priority(item: str) -> int:
     return string.ascii_letters.index(item) + 1
 
 
+def get_raw_priorities_sum(raw_ruckpacks: Iterable[bytes]) -> int:
+    ruckpacks = iter(raw_ruckpacks)
+    return sum(
+        get_shared_priority(*three_ruckpacks)
+        for three_ruckpacks in zip(ruckpacks, ruckpacks, ruckpacks, strict=True)
+    )
+
+
+def solve(input_path: Path) -> int:
+    return get_raw_priorities_sum(read_raw_lines(input_path))
+
+
 def test_get_priorities_sum():
     assert (
         get_priorities_sum(
@@ -56,7 +70,14 @@ def test_get_item_priority():
     assert get_item_priority("t") == 20
 
 
+def test_solve_matches_sets(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(3, 2000))
+    ruckpacks = input_path.read_text().splitlines()
+    assert solve(input_path) == get_priorities_sum(ruckpacks)
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        ruckpacks = [line.rstrip("\n") for line in f]
-    print(get_priorities_sum(ruckpacks))
+    print(solve(Path(__file__).parent / "input.txt"))
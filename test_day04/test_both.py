@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from aoc.inputs import map_input
+
+from . import test_ex07, test_ex08
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    contained = overlapping = 0
+    with map_input(input_path) as buffer:
+        for bounds in test_ex07.iter_packed_section_pairs(buffer):
+            for section_pair in test_ex07.unpack_section_pairs(bounds):
+                contained += test_ex07.is_one_range_fully_contained(*section_pair)
+                overlapping += test_ex08.are_ranges_overlapping(*section_pair)
+    return contained, overlapping
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(4, 2000))
+    assert solve(input_path) == (
+        test_ex07.solve(input_path),
+        test_ex08.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,5 +1,11 @@
+from array import array
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
+
+from aoc.inputs import Buffer, iter_line_block_bounds, map_input
+from aoc.parsing import EXTRACT_BLOCK_SIZE, compile_malformed_line, extract_ints
+
+_MALFORMED_SECTION_PAIR = compile_malformed_line(rb"[0-9]+-[0-9]+,[0-9]+-[0-9]+")
 
 
 def is_one_range_fully_contained(sections1: range, sections2: range) -> bool:
@@ -7,18 +13,43 @@ def is_one_range_fully_contained(sections1: range, sections2: range) -> bool:
     return set1.issubset(set2) or set1.issuperset(set2)
 
 
+def parse_packed_section_pairs(data: Buffer) -> array:
+    """Bounds of every pair, four per line: start1, end1, start2, end2."""
+    data = bytes(data)
+    if _MALFORMED_SECTION_PAIR.search(data):
+        raise ValueError("every line must have two ranges, like 2-4,6-8")
+    return extract_ints(data)
+
+
+def unpack_section_pairs(bounds: array) -> Iterator[Tuple[range, range]]:
+    values = iter(bounds)
+    for start1, end1, start2, end2 in zip(values, values, values, values):
+        yield range(start1, end1 + 1), range(start2, end2 + 1)
+
+
+def iter_packed_section_pairs(data: Buffer) -> Iterator[array]:
+    """`parse_packed_section_pairs` of each block of lines, so memory stays bounded."""
+    for start, end in iter_line_block_bounds(data, EXTRACT_BLOCK_SIZE):
+        yield parse_packed_section_pairs(data[start:end])
+
+
+def parse_section_pairs(data: Buffer) -> Iterator[Tuple[range, range]]:
+    for bounds in iter_packed_section_pairs(data):
+        yield from unpack_section_pairs(bounds)
+
+
 def parse_line(line: str) -> Tuple[range, range]:
-    #  mypy cries (with reason) about you can't assure that this will be a 2 items tuple
-    #  return tuple(
-    #     range(int(start), int(end) + 1)
-    #     for start, end in (elf.split("-") for elf in line.split(","))
-    # )
-    raw1, raw2 = line.split(",")
-    raw_start1, raw_end1 = raw1.split("-")
-    raw_start2, raw_end2 = raw2.split("-")
-    return range(int(raw_start1), int(raw_end1) + 1), range(
-        int(raw_start2), int(raw_end2) + 1
-    )
+    (section_pair,) = parse_section_pairs(line.encode())
+    return section_pair
+
+
+def solve(input_path: Path) -> int:
+    with map_input(input_path) as buffer:
+        return sum(
+            1
+            for section_pair in parse_section_pairs(buffer)
+            if is_one_range_fully_contained(*section_pair)
+        )
 
 
 def test_is_one_range_fully_contained():
@@ -26,18 +57,31 @@ def test_is_one_range_fully_contained():
     assert is_one_range_fully_contained(range(2, 9), range(3, 8)) is True
 
 
+def test_parse_section_pairs():
+    import pytest
+
+    assert list(parse_section_pairs(b"2-4,6-8\n2-8,3-7\n")) == [
+        (range(2, 5), range(6, 9)),
+        (range(2, 9), range(3, 8)),
+    ]
+    for malformed in (b"2-4,6-8\n2-8\n", b"2-4,6-8,1\n2-8,3\n", b"2-4,6-8\n\n"):
+        with pytest.raises(ValueError):
+            list(parse_section_pairs(malformed))
+
+
+def test_parse_packed_section_pairs():
+    bounds = parse_packed_section_pairs(b"2-4,6-8\n2-8,3-7")
+    assert bounds == array("q", [2, 4, 6, 8, 2, 8, 3, 7])
+    assert list(unpack_section_pairs(bounds)) == [
+        (range(2, 5), range(6, 9)),
+        (range(2, 9), range(3, 8)),
+    ]
+
+
 def test_parse_line():
     assert parse_line("2-4,6-8") == (range(2, 5), range(6, 9))
     assert parse_line("2-8,3-7") == (range(2, 9), range(3, 8))
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        section_pairs = [parse_line(line.rstrip("\n")) for line in f]
-    print(
-        sum(
-            1
-            for section_pair in section_pairs
-            if is_one_range_fully_contained(*section_pair)
-        )
-    )
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Tuple
+from aoc.inputs import map_input
+
+from .test_ex07 import parse_section_pairs
 
 
 def are_ranges_overlapping(sections1: range, sections2: range) -> bool:
@@ -7,13 +9,13 @@ def are_ranges_overlapping(sections1: range, sections2: range) -> bool:
     return bool(set1.intersection(set2))
 
 
-def parse_line(line: str) -> Tuple[range, range]:
-    raw1, raw2 = line.split(",")
-    raw_start1, raw_end1 = raw1.split("-")
-    raw_start2, raw_end2 = raw2.split("-")
-    return range(int(raw_start1), int(raw_end1) + 1), range(
-        int(raw_start2), int(raw_end2) + 1
-    )
+def solve(input_path: Path) -> int:
+    with map_input(input_path) as buffer:
+        return sum(
+            1
+            for section_pair in parse_section_pairs(buffer)
+            if are_ranges_overlapping(*section_pair)
+        )
 
 
 def test_are_ranges_overlapping():
@@ -22,16 +24,5 @@ def test_are_ranges_overlapping():
     assert are_ranges_overlapping(range(5, 8), range(7, 10)) is True
 
 
-def test_parse_line():
-    assert parse_line("2-4,6-8") == (range(2, 5), range(6, 9))
-    assert parse_line("2-8,3-7") == (range(2, 9), range(3, 8))
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        section_pairs = [parse_line(line.rstrip("\n")) for line in f]
-    print(
-        sum(
-            1 for section_pair in section_pairs if are_ranges_overlapping(*section_pair)
-        )
-    )
+    print(solve(Path(__file__).parent / "input.txt"))
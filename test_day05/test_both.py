@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from aoc.cache import cached_parse
+
+from . import test_ex09, test_ex10
+
+
+def solve(input_path: Path) -> tuple[str, str]:
+    stacks, instructions = cached_parse(test_ex09.parse_input, input_path)
+    # the first crane moves crates in place, so it gets its own copy of the stacks
+    stacks_copy = [stack.copy() for stack in stacks]
+    return (
+        test_ex09.get_top_crates_after_instructions(stacks_copy, instructions),
+        test_ex10.get_top_crates_after_instructions(stacks, instructions),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(5, 2000))
+    assert solve(input_path) == (
+        test_ex09.solve(input_path),
+        test_ex10.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
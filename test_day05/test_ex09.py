@@ -1,7 +1,10 @@
-import re
 from pathlib import Path
 from dataclasses import dataclass
 
+from aoc.cache import cached_parse
+from aoc.inputs import map_input
+from aoc.parsing import extract_ints
+
 
 @dataclass(frozen=True)
 class Instruction:
@@ -35,8 +38,25 @@ def parse_raw_stacks(raw_stacks: list[str]) -> list[list[str]]:
 
 
 def parse_instruction(raw_instruction: str) -> Instruction:
-    raw_numbers = re.findall(r"move (\d+) from (\d+) to (\d+)", raw_instruction)[0]
-    return Instruction(int(raw_numbers[0]), int(raw_numbers[1]), int(raw_numbers[2]))
+    quantity, origin, destination = extract_ints(raw_instruction.encode())
+    return Instruction(quantity, origin, destination)
+
+
+def parse_input(input_path: Path) -> tuple[list[list[str]], list[Instruction]]:
+    with map_input(input_path) as buffer:
+        stacks_end = buffer.find(b"\n\n")
+        raw_stacks = buffer[:stacks_end].decode().splitlines()
+        numbers = iter(extract_ints(buffer[stacks_end:]))
+    instructions = [
+        Instruction(quantity, origin, destination)
+        for quantity, origin, destination in zip(numbers, numbers, numbers)
+    ]
+    return parse_raw_stacks(raw_stacks), instructions
+
+
+def solve(input_path: Path) -> str:
+    stacks, instructions = cached_parse(parse_input, input_path)
+    return get_top_crates_after_instructions(stacks, instructions)
 
 
 def test_get_top_crates_after_instructions():
@@ -72,15 +92,4 @@ def test_parse_instruction():
 
 
 if __name__ == "__main__":
-    raw_stacks: list[str] = []
-    instructions: list[Instruction] = []
-    with open((Path(__file__).parent / "input.txt")) as f:
-        for line in f:
-            clean_line = line.rstrip("\n")
-            if clean_line[0:4] == "move":
-                instructions.append(parse_instruction(clean_line))
-            elif clean_line != "":
-                raw_stacks.append(clean_line)
-
-    stacks = parse_raw_stacks(raw_stacks)
-    print(get_top_crates_after_instructions(stacks, instructions))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from aoc.inputs import read_lines
+
+from . import test_ex11, test_ex12
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    datastream = next(read_lines(input_path))
+    return (
+        test_ex11.get_start_of_packet_index(datastream),
+        test_ex12.get_start_of_message_index(datastream),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(6, 2000))
+    assert solve(input_path) == (
+        test_ex11.solve(input_path),
+        test_ex12.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,15 +1,22 @@
 from pathlib import Path
 
-from more_itertools import sliding_window
+from aoc.inputs import read_lines
 
 
 def get_start_of_message_index(datastream: str) -> int:
+    from more_itertools import sliding_window
+
     for i, chars in enumerate(sliding_window(datastream, 14), 14):
         if len(chars) == len(set(chars)):
             return i
     raise Exception("Start of packet not found :(")
 
 
+def solve(input_path: Path) -> int:
+    datastream = next(read_lines(input_path))
+    return get_start_of_message_index(datastream)
+
+
 def test_get_start_of_message_index():
     assert get_start_of_message_index("mjqjpqmgbljsphdztnvjfqwrcgsmlb") == 19
     assert get_start_of_message_index("bvwbjplbgvbhsrlpgdmjqwftvncz") == 23
@@ -17,6 +24,4 @@ def test_get_start_of_message_index():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        datastream = [line.rstrip("\n") for line in f][0]
-    print(get_start_of_message_index(datastream))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from aoc.cache import cached_parse
+
+from . import test_ex13, test_ex14
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    tree = test_ex13.execute_commands(cached_parse(test_ex13.parse_input, input_path))
+    return (
+        test_ex13.get_sum_of_sizes_with_max_size(tree),
+        test_ex14.get_directory_to_delete_size(tree),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(7, 2000))
+    assert solve(input_path) == (
+        test_ex13.solve(input_path),
+        test_ex14.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
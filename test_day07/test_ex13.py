@@ -2,7 +2,9 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import Iterable
 
-from more_itertools import split_before
+from aoc.cache import cached_parse
+from aoc.inputs import read_lines
+from aoc.instrument import instrument
 
 
 @dataclass(frozen=True)
@@ -30,6 +32,7 @@ class Folder:
         return Folder(name, {}, {}, parent)
 
     @property
+    @instrument
     def size(self) -> int:
         return sum(
             item.size
@@ -59,6 +62,8 @@ def execute_commands(commands: list[Command]) -> Folder:
 
 
 def parse_lines_to_commands(lines: Iterable[str]) -> list[Command]:
+    from more_itertools import split_before
+
     return [
         Command(group[0].strip("$ "), group[1:])
         for group in split_before(lines, lambda line: line[0] == "$")
@@ -72,6 +77,15 @@ def get_sum_of_sizes_with_max_size(tree: Folder, max_size: int = 100000) -> int:
     return sum_of_sizes
 
 
+def parse_input(input_path: Path) -> list[Command]:
+    return parse_lines_to_commands(read_lines(input_path))
+
+
+def solve(input_path: Path) -> int:
+    tree = execute_commands(cached_parse(parse_input, input_path))
+    return get_sum_of_sizes_with_max_size(tree)
+
+
 def test_parse_lines_to_commands():
     assert parse_lines_to_commands(
         [
@@ -156,8 +170,16 @@ def test_get_sum_of_sizes_with_max_size():
     assert get_sum_of_sizes_with_max_size(tree, 100000) == 95437
 
 
+def test_get_sum_of_sizes_with_max_size_perf(perf):
+    from aoc.generators import generate_input
+
+    lines = generate_input(7, 20000).splitlines()
+    perf(
+        lambda: get_sum_of_sizes_with_max_size(
+            execute_commands(parse_lines_to_commands(lines))
+        )
+    )
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
-    tree = execute_commands(parse_lines_to_commands(lines))
-    print(get_sum_of_sizes_with_max_size(tree))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -1,68 +1,8 @@
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Iterable
 
-from more_itertools import split_before
+from aoc.cache import cached_parse
 
-
-@dataclass(frozen=True)
-class Command:
-    instrucion: str
-    output: list[str]
-
-
-@dataclass(frozen=True)
-class File:
-    name: str
-    size: int
-    parent: "Folder"
-
-
-@dataclass(frozen=True)
-class Folder:
-    name: str
-    files: dict[str, File]
-    folders: dict[str, "Folder"]
-    parent: "Folder | None"
-
-    @staticmethod
-    def create_empty(name: str, parent: "Folder | None" = None) -> "Folder":
-        return Folder(name, {}, {}, parent)
-
-    @property
-    def size(self) -> int:
-        return sum(
-            item.size
-            for item in list(self.files.values()) + list(self.folders.values())
-        )
-
-
-def execute_commands(commands: list[Command]) -> Folder:
-    tree = Folder.create_empty("/")
-    actual = tree
-    for command in commands[1:]:
-        if command.instrucion == "ls":
-            for item in command.output:
-                if item.startswith("dir"):
-                    name = item.split()[1]
-                    actual.folders[name] = Folder.create_empty(name, actual)
-                else:
-                    raw_size, name = item.split()
-                    actual.files[name] = File(name, int(raw_size), actual)
-        else:
-            folder_name = command.instrucion.split()[1]
-            if folder_name == "..":
-                actual = actual.parent  # type: ignore
-            else:
-                actual = actual.folders[folder_name]
-    return tree
-
-
-def parse_lines_to_commands(lines: Iterable[str]) -> list[Command]:
-    return [
-        Command(group[0].strip("$ "), group[1:])
-        for group in split_before(lines, lambda line: line[0] == "$")
-    ]
+from .test_ex13 import Folder, execute_commands, parse_input, parse_lines_to_commands
 
 
 def get_directory_to_delete_size(
@@ -79,6 +19,11 @@ def _get_directories_to_delete_sizes(tree: Folder, min_file_size: int) -> list[i
     return to_delete_sizes
 
 
+def solve(input_path: Path) -> int:
+    tree = execute_commands(cached_parse(parse_input, input_path))
+    return get_directory_to_delete_size(tree)
+
+
 def test_get_directory_to_delete():
     tree = execute_commands(
         parse_lines_to_commands(
@@ -112,8 +57,16 @@ def test_get_directory_to_delete():
     assert get_directory_to_delete_size(tree, 70000000, 30000000) == 24933642
 
 
+def test_get_directory_to_delete_size_perf(perf):
+    from aoc.generators import generate_input
+
+    lines = generate_input(7, 20000).splitlines()
+    perf(
+        lambda: get_directory_to_delete_size(
+            execute_commands(parse_lines_to_commands(lines))
+        )
+    )
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
-    tree = execute_commands(parse_lines_to_commands(lines))
-    print(get_directory_to_delete_size(tree))
+    print(solve(Path(__file__).parent / "input.txt"))
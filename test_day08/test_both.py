@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from aoc.cache import cached_parse
+
+from . import test_ex13, test_ex14
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    grid = cached_parse(test_ex13.parse_input, input_path)
+    return test_ex13.count_visible_trees(grid), test_ex14.get_max_scenic_score(grid)
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(8, 2000))
+    assert solve(input_path) == (
+        test_ex13.solve(input_path),
+        test_ex14.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,35 +1,39 @@
 from pathlib import Path
 from typing import Iterable
 
+from aoc.cache import cached_parse
+from aoc.grid import Grid
+from aoc.inputs import map_input
+from aoc.instrument import instrument
 
-TreeGrid = list[list[int]]
 
+def parse_tree_grid(lines: Iterable[str]) -> Grid:
+    return Grid.from_lines(lines)
 
-def parse_tree_grid(lines: Iterable[str]) -> TreeGrid:
-    return [[int(num) for num in line] for line in lines]
 
+def count_visible_trees(grid: Grid) -> int:
+    return sum(1 for x, y in grid.positions() if is_tree_visible(grid, x, y))
 
-def count_visible_trees(grid: TreeGrid) -> int:
-    return sum(
-        1
-        for x in range(len(grid))
-        for y in range(len(grid[0]))
-        if is_tree_visible(grid, x, y)
-    )
 
+@instrument
+def is_tree_visible(grid: Grid, x: int, y: int) -> bool:
+    heigth = grid[x, y]
+    return any(heigth > max(ray, default=-1) for ray in grid.rays((x, y)))
+
+
+def parse_input(input_path: Path) -> Grid:
+    with map_input(input_path) as buffer:
+        return Grid.from_digits(buffer)
 
-def is_tree_visible(grid: TreeGrid, x: int, y: int) -> bool:
-    heigth = grid[x][y]
-    return (
-        heigth > max(grid[x][0:y] or [-1])
-        or heigth > max(grid[x][y + 1 :] or [-1])
-        or heigth > max([grid[i][y] for i in range(x + 1, len(grid))] or [-1])
-        or heigth > max([grid[i][y] for i in range(x)] or [-1])
-    )
+
+def solve(input_path: Path) -> int:
+    grid = cached_parse(parse_input, input_path)
+    return count_visible_trees(grid)
 
 
 def test_parse_tree_grid():
-    assert parse_tree_grid(["30373", "25512", "65332", "33549", "35390"]) == [
+    grid = parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
+    assert [list(row) for row in grid.rows()] == [
         [3, 0, 3, 7, 3],
         [2, 5, 5, 1, 2],
         [6, 5, 3, 3, 2],
@@ -39,13 +43,7 @@ def test_parse_tree_grid():
 
 
 def test_is_tree_visible():
-    grid = [
-        [3, 0, 3, 7, 3],
-        [2, 5, 5, 1, 2],
-        [6, 5, 3, 3, 2],
-        [3, 3, 5, 4, 9],
-        [3, 5, 3, 9, 0],
-    ]
+    grid = parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
     assert is_tree_visible(grid, 0, 0) is True
     assert is_tree_visible(grid, 1, 4) is True
     assert is_tree_visible(grid, 4, 2) is True
@@ -60,20 +58,18 @@ def test_is_tree_visible():
 def test_count_visible_trees():
     assert (
         count_visible_trees(
-            [
-                [3, 0, 3, 7, 3],
-                [2, 5, 5, 1, 2],
-                [6, 5, 3, 3, 2],
-                [3, 3, 5, 4, 9],
-                [3, 5, 3, 9, 0],
-            ]
+            parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
         )
         == 21
     )
 
 
+def test_count_visible_trees_perf(perf):
+    from aoc.generators import generate_input
+
+    grid = parse_tree_grid(generate_input(8, 2500).splitlines())
+    perf(lambda: count_visible_trees(grid))
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
-    grid = parse_tree_grid(lines)
-    print(count_visible_trees(grid))
+    print(solve(Path(__file__).parent / "input.txt"))
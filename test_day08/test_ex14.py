@@ -1,30 +1,24 @@
 from pathlib import Path
 from typing import Iterable
 
+from aoc.cache import cached_parse
+from aoc.grid import Grid
+from aoc.inputs import map_input
+from aoc.instrument import instrument
 
-TreeGrid = list[list[int]]
 
+def parse_tree_grid(lines: Iterable[str]) -> Grid:
+    return Grid.from_lines(lines)
 
-def parse_tree_grid(lines: Iterable[str]) -> TreeGrid:
-    return [[int(num) for num in line] for line in lines]
 
+def get_max_scenic_score(grid: Grid) -> int:
+    return max(get_scenic_score(grid, x, y) for x, y in grid.positions())
 
-def get_max_scenic_score(grid: TreeGrid) -> int:
-    return max(
-        get_scenic_score(grid, x, y)
-        for x in range(len(grid))
-        for y in range(len(grid[0]))
-    )
-
-
-def get_scenic_score(grid: TreeGrid, x: int, y: int) -> int:
-    heigth = grid[x][y]
-
-    right = grid[x][y + 1 :]
-    left = grid[x][0:y][::-1]
-    down = [grid[i][y] for i in range(x + 1, len(grid))]
-    up = [grid[i][y] for i in range(x)][::-1]
 
+@instrument
+def get_scenic_score(grid: Grid, x: int, y: int) -> int:
+    heigth = grid[x, y]
+    right, left, down, up = grid.rays((x, y))
     return (
         _get_direction_scenic_score(heigth, right)
         * _get_direction_scenic_score(heigth, left)
@@ -33,7 +27,7 @@ def get_scenic_score(grid: TreeGrid, x: int, y: int) -> int:
     )
 
 
-def _get_direction_scenic_score(height: int, direction: list[int]) -> int:
+def _get_direction_scenic_score(height: int, direction: Iterable[int]) -> int:
     score = 0
     for i in direction:
         score += 1
@@ -42,8 +36,19 @@ def _get_direction_scenic_score(height: int, direction: list[int]) -> int:
     return score
 
 
+def parse_input(input_path: Path) -> Grid:
+    with map_input(input_path) as buffer:
+        return Grid.from_digits(buffer)
+
+
+def solve(input_path: Path) -> int:
+    grid = cached_parse(parse_input, input_path)
+    return get_max_scenic_score(grid)
+
+
 def test_parse_tree_grid():
-    assert parse_tree_grid(["30373", "25512", "65332", "33549", "35390"]) == [
+    grid = parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
+    assert [list(row) for row in grid.rows()] == [
         [3, 0, 3, 7, 3],
         [2, 5, 5, 1, 2],
         [6, 5, 3, 3, 2],
@@ -53,33 +58,25 @@ def test_parse_tree_grid():
 
 
 def test_get_scenic_score():
-    grid = [
-        [3, 0, 3, 7, 3],
-        [2, 5, 5, 1, 2],
-        [6, 5, 3, 3, 2],
-        [3, 3, 5, 4, 9],
-        [3, 5, 3, 9, 0],
-    ]
+    grid = parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
     assert get_scenic_score(grid, 1, 2) == 4
 
 
 def test_get_max_scenic_score():
     assert (
         get_max_scenic_score(
-            [
-                [3, 0, 3, 7, 3],
-                [2, 5, 5, 1, 2],
-                [6, 5, 3, 3, 2],
-                [3, 3, 5, 4, 9],
-                [3, 5, 3, 9, 0],
-            ]
+            parse_tree_grid(["30373", "25512", "65332", "33549", "35390"])
         )
         == 8
     )
 
 
+def test_get_max_scenic_score_perf(perf):
+    from aoc.generators import generate_input
+
+    grid = parse_tree_grid(generate_input(8, 2500).splitlines())
+    perf(lambda: get_max_scenic_score(grid))
+
+
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
-    grid = parse_tree_grid(lines)
-    print(get_max_scenic_score(grid))
+    print(solve(Path(__file__).parent / "input.txt"))
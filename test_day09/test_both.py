@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from aoc.inputs import map_input
+
+from . import test_ex15, test_ex16
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    with map_input(input_path) as buffer:
+        moves = test_ex15.parse_packed_moves(buffer)
+    short_rope = test_ex15.RopeSimulator()
+    long_rope = test_ex16.RopeSimulator()
+    for move in test_ex15.unpack_moves(moves):
+        short_rope.move(*move)
+        long_rope.move(*move)
+    return short_rope.count_tail_visited_tiles(), long_rope.count_tail_visited_tiles()
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(9, 2000))
+    assert solve(input_path) == (
+        test_ex15.solve(input_path),
+        test_ex16.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
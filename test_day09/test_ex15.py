@@ -1,5 +1,11 @@
+from array import array
 from pathlib import Path
 from dataclasses import dataclass, field
+from typing import Iterator
+
+from aoc.inputs import Buffer, read_lines
+from aoc.instrument import instrument
+from aoc.parsing import compile_malformed_line, extract_ints
 
 
 @dataclass(frozen=True)
@@ -13,6 +19,11 @@ LEFT = Direction(-1, 0)
 UP = Direction(0, 1)
 DOWN = Direction(0, -1)
 
+DIRECTIONS = {"R": RIGHT, "L": LEFT, "U": UP, "D": DOWN}
+
+PackedMoves = tuple[bytes, array]  # a direction letter and a step count per move
+_MALFORMED_MOVE = compile_malformed_line(rb"[RLUD] [0-9]+")
+
 
 @dataclass(frozen=True)
 class Position:
@@ -23,11 +34,36 @@ class Position:
         return Position(self.x + direction.delta_x, self.y + direction.delta_y)
 
 
+class VisitedTiles:
+    """Set of positions, each packed in a single int.
+
+    Memory grows with the tiles visited, not with the area the rope wanders.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self) -> None:
+        self._packed: set[int] = set()
+
+    @staticmethod
+    def _pack(position: Position) -> int:
+        return position.x << 32 | position.y & 0xFFFFFFFF
+
+    def add(self, position: Position) -> None:
+        self._packed.add(self._pack(position))
+
+    def __contains__(self, position: Position) -> bool:
+        return self._pack(position) in self._packed
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+
 @dataclass
 class RopeSimulator:
     head: Position = Position(0, 0)
     tail: Position = Position(0, 0)
-    _tail_visited_tiles: set[Position] = field(default_factory=set)
+    _tail_visited_tiles: VisitedTiles = field(default_factory=VisitedTiles)
 
     def move(self, direction: Direction, steps: int) -> None:
         for _ in range(steps):
@@ -38,6 +74,7 @@ class RopeSimulator:
     def count_tail_visited_tiles(self) -> int:
         return len(self._tail_visited_tiles)
 
+    @instrument
     def _move_tail_if_needed(self) -> None:
         x_diff = self.head.x - self.tail.x
         y_diff = self.head.y - self.tail.y
@@ -54,9 +91,27 @@ class RopeSimulator:
 
 
 def parse_line(raw_line: str) -> tuple[Direction, int]:
-    _mapper = {"R": RIGHT, "L": LEFT, "U": UP, "D": DOWN}
     raw_dir, raw_count = raw_line.split()
-    return _mapper[raw_dir], int(raw_count)
+    return DIRECTIONS[raw_dir], int(raw_count)
+
+
+def parse_packed_moves(data: Buffer) -> PackedMoves:
+    data = bytes(data)
+    if _MALFORMED_MOVE.search(data):
+        raise ValueError("every line must be a direction and a count, like R 4")
+    return data.translate(None, b"0123456789 \r\n"), extract_ints(data)
+
+
+def unpack_moves(moves: PackedMoves) -> Iterator[tuple[Direction, int]]:
+    letters, steps = moves
+    return zip((DIRECTIONS[chr(letter)] for letter in letters), steps)
+
+
+def solve(input_path: Path) -> int:
+    simulator = RopeSimulator()
+    for line in read_lines(input_path):
+        simulator.move(*parse_line(line))
+    return simulator.count_tail_visited_tiles()
 
 
 def test_simuator_creation():
@@ -117,6 +172,16 @@ def test_simulation_count_tail_visited_tiles():
     assert simulator.count_tail_visited_tiles() == 13
 
 
+def test_visited_tiles():
+    visited = VisitedTiles()
+    for position in [Position(0, 0), Position(-3, 2), Position(5, -7), Position(0, 0)]:
+        visited.add(position)
+    assert len(visited) == 3
+    assert Position(-3, 2) in visited
+    assert Position(2, -3) not in visited
+    assert Position(-3, -2) not in visited
+
+
 def test_parse_line():
     assert parse_line("R 4") == (RIGHT, 4)
     assert parse_line("U 4") == (UP, 4)
@@ -124,11 +189,32 @@ def test_parse_line():
     assert parse_line("D 1") == (DOWN, 1)
 
 
-if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+def test_parse_packed_moves():
+    moves = parse_packed_moves(b"R 4\nU 4\nL 13\nD 1\n")
+    assert moves == (b"RULD", array("q", [4, 4, 13, 1]))
+    assert list(unpack_moves(moves)) == [(RIGHT, 4), (UP, 4), (LEFT, 13), (DOWN, 1)]
 
-    simulator = RopeSimulator()
-    for line in lines:
-        simulator.move(*parse_line(line))
-    print(simulator.count_tail_visited_tiles())
+
+def test_parse_packed_moves_rejects_malformed_lines():
+    import pytest
+
+    for malformed in (b"R 4 5\nU\n", b"R 4\nX 2\n", b"R4\n"):
+        with pytest.raises(ValueError):
+            parse_packed_moves(malformed)
+
+
+def test_simulation_perf(perf):
+    from aoc.generators import generate_input
+
+    moves = [parse_line(line) for line in generate_input(9, 2000).splitlines()]
+
+    def _simulate() -> None:
+        simulator = RopeSimulator()
+        for move in moves:
+            simulator.move(*move)
+
+    perf(_simulate)
+
+
+if __name__ == "__main__":
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -1,33 +1,25 @@
 from pathlib import Path
-from dataclasses import dataclass
 from itertools import pairwise
 
+from aoc.inputs import read_lines
+from aoc.instrument import instrument
 
-@dataclass(frozen=True)
-class Direction:
-    delta_x: int
-    delta_y: int
-
-
-RIGHT = Direction(1, 0)
-LEFT = Direction(-1, 0)
-UP = Direction(0, 1)
-DOWN = Direction(0, -1)
-
-
-@dataclass(frozen=True)
-class Position:
-    x: int
-    y: int
-
-    def get_next_position(self, direction: Direction) -> "Position":
-        return Position(self.x + direction.delta_x, self.y + direction.delta_y)
+from .test_ex15 import (
+    DOWN,
+    LEFT,
+    RIGHT,
+    UP,
+    Direction,
+    Position,
+    VisitedTiles,
+    parse_line,
+)
 
 
 class RopeSimulator:
     def __init__(self, rope_length: int = 10) -> None:
         self.rope: list[Position] = [Position(0, 0)] * rope_length
-        self._tail_visited_tiles: set[Position] = set()
+        self._tail_visited_tiles = VisitedTiles()
 
     @property
     def head(self) -> Position:
@@ -47,6 +39,7 @@ class RopeSimulator:
     def count_tail_visited_tiles(self) -> int:
         return len(self._tail_visited_tiles)
 
+    @instrument
     def _move_next_if_needed(self, i_actual: int, i_next: int) -> None:
         x_diff = self.rope[i_actual].x - self.rope[i_next].x
         y_diff = self.rope[i_actual].y - self.rope[i_next].y
@@ -58,10 +51,11 @@ class RopeSimulator:
             )
 
 
-def parse_line(raw_line: str) -> tuple[Direction, int]:
-    _mapper = {"R": RIGHT, "L": LEFT, "U": UP, "D": DOWN}
-    raw_dir, raw_count = raw_line.split()
-    return _mapper[raw_dir], int(raw_count)
+def solve(input_path: Path) -> int:
+    simulator = RopeSimulator()
+    for line in read_lines(input_path):
+        simulator.move(*parse_line(line))
+    return simulator.count_tail_visited_tiles()
 
 
 def test_simuator_creation():
@@ -70,11 +64,6 @@ def test_simuator_creation():
     assert simulator.tail == Position(0, 0)
 
 
-def test_direction_get_next_position():
-    assert Position(2, 6).get_next_position(RIGHT) == Position(3, 6)
-    assert Position(2, 6).get_next_position(LEFT) == Position(1, 6)
-
-
 def test_simulation_moving():
     simulator = RopeSimulator()
     simulator.move(RIGHT, 5)
@@ -109,18 +98,18 @@ def test_simulation_count_tail_visited_tiles():
     assert simulator.count_tail_visited_tiles() == 36
 
 
-def test_parse_line():
-    assert parse_line("R 4") == (RIGHT, 4)
-    assert parse_line("U 4") == (UP, 4)
-    assert parse_line("L 3") == (LEFT, 3)
-    assert parse_line("D 1") == (DOWN, 1)
+def test_simulation_perf(perf):
+    from aoc.generators import generate_input
 
+    moves = [parse_line(line) for line in generate_input(9, 2000).splitlines()]
 
-if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        lines = [line.rstrip("\n") for line in f]
+    def _simulate() -> None:
+        simulator = RopeSimulator()
+        for move in moves:
+            simulator.move(*move)
 
-    simulator = RopeSimulator()
-    for line in lines:
-        simulator.move(*parse_line(line))
-    print(simulator.count_tail_visited_tiles())
+    perf(_simulate)
+
+
+if __name__ == "__main__":
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from aoc.inputs import map_input
+
+from . import test_ex17, test_ex18
+
+
+def solve(input_path: Path) -> tuple[int, str]:
+    with map_input(input_path) as buffer:
+        instructions = test_ex17.parse_packed_program(buffer)
+    return (
+        test_ex17.get_total_signal_strength(
+            test_ex17.InstructionProcessor(instructions)
+        ),
+        test_ex18.InstructionProcessor(instructions).paint(),
+    )
+
+
+def test_solve(tmp_path: Path):
+    from aoc.generators import generate_input
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate_input(10, 2000))
+    assert solve(input_path) == (
+        test_ex17.solve(input_path),
+        test_ex18.solve(input_path),
+    )
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,7 +1,11 @@
-from typing import Any, Generator
+from array import array
+from typing import Any, Generator, Iterable
 from pathlib import Path
 from abc import ABC
 
+from aoc.inputs import Buffer, read_lines
+from aoc.parsing import compile_malformed_line, extract_ints
+
 
 class Instruction(ABC):
     def __init__(self, argument: int | None = None) -> None:
@@ -29,19 +33,29 @@ class AddxInstruction(Instruction):
         yield self.argument
 
 
+# a list of instructions, or the packed register increments of parse_packed_program
+Program = list[Instruction] | array
+_MALFORMED_INSTRUCTION = compile_malformed_line(rb"noop|addx -?[0-9]+")
+
+
+def get_cycle_increments(program: Program) -> Iterable[int | None]:
+    if isinstance(program, array):
+        return program
+    return (value for instruction in program for value in instruction.execute())
+
+
 class InstructionProcessor:
-    def __init__(self, instructions: list[Instruction]) -> None:
+    def __init__(self, instructions: Program) -> None:
         self._cycle: int = 0
         self._register: int = 1
-        self._instuctions: list[Instruction] = instructions
+        self._instuctions: Program = instructions
 
     def __iter__(self) -> Generator[int, None, None]:
-        for instruction in self._instuctions:
-            for value in instruction.execute():
-                signal_strength = (self.cycle + 1) * self.register
-                self._cycle += 1
-                self._register += value if value else 0
-                yield signal_strength
+        for value in get_cycle_increments(self._instuctions):
+            signal_strength = (self.cycle + 1) * self.register
+            self._cycle += 1
+            self._register += value if value else 0
+            yield signal_strength
 
     @property
     def cycle(self) -> int:
@@ -59,11 +73,52 @@ def parse_line(raw_line: str) -> Instruction:
     return AddxInstruction(int(raw_argument))
 
 
+def parse_packed_program(data: Buffer) -> array:
+    """Register increment of every cycle: 0 for noop, 0 and the argument for addx."""
+    data = bytes(data)
+    if _MALFORMED_INSTRUCTION.search(data):
+        raise ValueError("every line must be a noop or an addx instruction")
+    return extract_ints(data.replace(b"noop", b"0").replace(b"addx", b"0"), signed=True)
+
+
+def get_total_signal_strength(cpu: InstructionProcessor) -> int:
+    total_signal_strenght = 0
+    for i, signal_strenght in enumerate(cpu):
+        if i + 1 in (20, 60, 100, 140, 180, 220):
+            total_signal_strenght += signal_strenght
+    return total_signal_strenght
+
+
+def solve(input_path: Path) -> int:
+    instructions = [parse_line(line) for line in read_lines(input_path)]
+
+    cpu = InstructionProcessor(instructions)
+    return get_total_signal_strength(cpu)
+
+
 def test_parse_line():
     assert parse_line("noop") == NoopInstruction()
     assert parse_line("addx -3") == AddxInstruction(-3)
 
 
+def test_parse_packed_program():
+    program = parse_packed_program(b"noop\naddx 3\naddx -5\n")
+    assert program == array("q", [0, 0, 3, 0, -5])
+    cpu = InstructionProcessor(program)
+    for _ in cpu:
+        ...
+    assert cpu.cycle == 5
+    assert cpu.register == -1
+
+
+def test_parse_packed_program_rejects_malformed_lines():
+    import pytest
+
+    for malformed in (b"noop 3\naddx\n", b"noop\naddx 1 2\n", b"noopnoop\n"):
+        with pytest.raises(ValueError):
+            parse_packed_program(malformed)
+
+
 def test_empty_processor():
     cpu = InstructionProcessor([])
     flag = True
@@ -132,12 +187,4 @@ def test_signal_strength():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        instructions = [parse_line(line.rstrip("\n")) for line in f]
-
-    cpu = InstructionProcessor(instructions)
-    total_signal_strenght = 0
-    for i, signal_strenght in enumerate(cpu):
-        if i + 1 in (20, 60, 100, 140, 180, 220):
-            total_signal_strenght += signal_strenght
-    print(total_signal_strenght)
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -1,51 +1,33 @@
-from typing import Any, Generator
+from typing import Generator
 from pathlib import Path
-from abc import ABC
 
+from aoc.inputs import read_lines
 
-class Instruction(ABC):
-    def __init__(self, argument: int | None = None) -> None:
-        self.argument = argument
-
-    def execute(self) -> Generator[int | None, None, None]:
-        yield None
-
-    def __eq__(self, other: Any) -> bool:
-        if isinstance(other, type(self)):
-            return self.argument == other.argument
-        return False
-
-    def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.argument})"
-
-
-class NoopInstruction(Instruction):
-    ...
-
-
-class AddxInstruction(Instruction):
-    def execute(self) -> Generator[int | None, None, None]:
-        yield None
-        yield self.argument
+from .test_ex17 import (
+    AddxInstruction,
+    NoopInstruction,
+    Program,
+    get_cycle_increments,
+    parse_line,
+)
 
 
 class InstructionProcessor:
     WIDTH = 40
 
-    def __init__(self, instructions: list[Instruction]) -> None:
+    def __init__(self, instructions: Program) -> None:
         self._cycle: int = 0
         self._register: int = 1
-        self._instuctions: list[Instruction] = instructions
+        self._instuctions: Program = instructions
 
     def __iter__(self) -> Generator[str, None, None]:
-        for instruction in self._instuctions:
-            for value in instruction.execute():
-                pixel = "."
-                if (self.register - 1) <= (self.cycle % self.WIDTH) < self.register + 2:
-                    pixel = "#"
-                self._cycle += 1
-                self._register += value if value else 0
-                yield pixel
+        for value in get_cycle_increments(self._instuctions):
+            pixel = "."
+            if (self.register - 1) <= (self.cycle % self.WIDTH) < self.register + 2:
+                pixel = "#"
+            self._cycle += 1
+            self._register += value if value else 0
+            yield pixel
 
     def paint(self) -> str:
         printed = ""
@@ -64,16 +46,11 @@ class InstructionProcessor:
         return self._register
 
 
-def parse_line(raw_line: str) -> Instruction:
-    if raw_line == "noop":
-        return NoopInstruction()
-    _, raw_argument = raw_line.split()
-    return AddxInstruction(int(raw_argument))
-
+def solve(input_path: Path) -> str:
+    instructions = [parse_line(line) for line in read_lines(input_path)]
 
-def test_parse_line():
-    assert parse_line("noop") == NoopInstruction()
-    assert parse_line("addx -3") == AddxInstruction(-3)
+    cpu = InstructionProcessor(instructions)
+    return cpu.paint()
 
 
 def test_empty_processor():
@@ -118,8 +95,4 @@ def test_iterative_painting():
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        instructions = [parse_line(line.rstrip("\n")) for line in f]
-
-    cpu = InstructionProcessor(instructions)
-    print(cpu.paint())
+    print(solve(Path(__file__).parent / "input.txt"))
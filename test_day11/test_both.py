@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from aoc.cache import cached_parse
+
+from . import test_ex17, test_ex18
+
+
+def solve(input_path: Path) -> tuple[int, int]:
+    monkeys = cached_parse(test_ex17.parse_input, input_path)
+    # part two monkeys never get bored, but start from the same parsed state
+    relentless_monkeys = [
+        test_ex18.Monkey(
+            monkey.id,
+            monkey.items.copy(),
+            monkey.operation,
+            monkey.divisible_test,
+            monkey.true_target,
+            monkey.false_target,
+        )
+        for monkey in monkeys
+    ]
+    return (
+        test_ex17.get_monkey_business_level(monkeys),
+        test_ex18.get_monkey_business_level(relentless_monkeys, 10000),
+    )
+
+
+def test_solve(tmp_path: Path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(
+        "\n\n".join(
+            "\n".join(chunk)
+            for chunk in [
+                [
+                    "Monkey 0:",
+                    "  Starting items: 79, 98",
+                    "  Operation: new = old * 19",
+                    "  Test: divisible by 23",
+                    "    If true: throw to monkey 2",
+                    "    If false: throw to monkey 3",
+                ],
+                [
+                    "Monkey 1:",
+                    "  Starting items: 54, 65, 75, 74",
+                    "  Operation: new = old + 6",
+                    "  Test: divisible by 19",
+                    "    If true: throw to monkey 2",
+                    "    If false: throw to monkey 0",
+                ],
+                [
+                    "Monkey 2:",
+                    "  Starting items: 79, 60, 97",
+                    "  Operation: new = old * old",
+                    "  Test: divisible by 13",
+                    "    If true: throw to monkey 1",
+                    "    If false: throw to monkey 3",
+                ],
+                [
+                    "Monkey 3:",
+                    "  Starting items: 74",
+                    "  Operation: new = old + 3",
+                    "  Test: divisible by 17",
+                    "    If true: throw to monkey 0",
+                    "    If false: throw to monkey 1",
+                ],
+            ]
+        )
+    )
+    assert solve(input_path) == (10605, 2713310158)
+
+
+if __name__ == "__main__":
+    print(*solve(Path(__file__).parent / "input.txt"), sep="\n")
@@ -1,8 +1,11 @@
 from pathlib import Path
-from typing import List, Generator, Any
-from itertools import takewhile
 from dataclasses import dataclass
 
+from aoc.cache import cached_parse
+from aoc.inputs import read_chunks
+from aoc.instrument import instrument
+from aoc.parsing import extract_ints
+
 
 @dataclass(frozen=True)
 class ItemMovement:
@@ -20,6 +23,7 @@ class Monkey:
     false_target: int
     inspection_count: int = 0
 
+    @instrument
     def inspect_next_item(self) -> ItemMovement:
         if not self.items:
             raise StopIteration
@@ -41,7 +45,7 @@ class Monkey:
 def build_monkey_from_text(text: list[str]) -> Monkey:
     # assumes less than 10 monkeys
     id_ = int(text[0].split()[1][0])
-    items = [int(i) for i in text[1].split(": ")[1].split(", ")]
+    items = list(extract_ints(text[1].encode()))
     operation = text[2].split("= ")[1]
     divisible_test = int(text[3].split("by ")[1])
     true_target = int(text[4][-1])
@@ -49,12 +53,6 @@ def build_monkey_from_text(text: list[str]) -> Monkey:
     return Monkey(id_, items, operation, divisible_test, true_target, false_target)
 
 
-def generate_chunks_of_lines(raw_lines: List[Any]) -> Generator[List[Any], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while lines := list(takewhile(lambda line: bool(line), raw_lines_iterator)):
-        yield lines
-
-
 def get_monkey_business_level(monkeys: list[Monkey]) -> int:
     for _ in range(20):
         for monkey in monkeys:
@@ -109,6 +107,18 @@ def _get_test_monkeys() -> list[Monkey]:
     return [monkey0, monkey1, monkey2, monkey3]
 
 
+def parse_input(input_path: Path) -> list[Monkey]:
+    return [
+        build_monkey_from_text(chunk.decode().splitlines())
+        for chunk in read_chunks(input_path)
+    ]
+
+
+def solve(input_path: Path) -> int:
+    monkeys = cached_parse(parse_input, input_path)
+    return get_monkey_business_level(monkeys)
+
+
 def test_build_monkey_from_text():
     monkey = _get_test_monkeys()[0]
     assert monkey.id == 0
@@ -142,15 +152,16 @@ def test_get_monkey_business_level():
     assert get_monkey_business_level(monkeys) == 10605
 
 
-def test_generate_chunks_of_lines() -> None:
-    assert list(
-        generate_chunks_of_lines(["a", "b", "", "c", "d", "", "e", "f", "g"])
-    ) == [["a", "b"], ["c", "d"], ["e", "f", "g"]]
+def test_get_monkey_business_level_perf(perf):
+    from aoc.generators import generate_input
+
+    chunks = [chunk.splitlines() for chunk in generate_input(11, 2000).split("\n\n")]
+    perf(
+        lambda: get_monkey_business_level(
+            [build_monkey_from_text(chunk) for chunk in chunks]
+        )
+    )
 
 
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-    chunks_of_calories = generate_chunks_of_lines(raw_lines)
-    monkeys = [build_monkey_from_text(chunk) for chunk in chunks_of_calories]
-    print(get_monkey_business_level(monkeys))
+    print(solve(Path(__file__).parent / "input.txt"))
@@ -1,8 +1,11 @@
 from pathlib import Path
-from typing import List, Generator, Any
-from itertools import takewhile
 from dataclasses import dataclass
 
+from aoc.cache import cached_parse
+from aoc.inputs import read_chunks
+from aoc.instrument import instrument
+from aoc.parsing import extract_ints
+
 
 @dataclass(frozen=True)
 class ItemMovement:
@@ -20,6 +23,7 @@ class Monkey:
     false_target: int
     inspection_count: int = 0
 
+    @instrument
     def inspect_next_item(self) -> ItemMovement:
         if not self.items:
             raise StopIteration
@@ -40,7 +44,7 @@ class Monkey:
 def build_monkey_from_text(text: list[str]) -> Monkey:
     # assumes less than 10 monkeys
     id_ = int(text[0].split()[1][0])
-    items = [int(i) for i in text[1].split(": ")[1].split(", ")]
+    items = list(extract_ints(text[1].encode()))
     operation = text[2].split("= ")[1]
     divisible_test = int(text[3].split("by ")[1])
     true_target = int(text[4][-1])
@@ -48,12 +52,6 @@ def build_monkey_from_text(text: list[str]) -> Monkey:
     return Monkey(id_, items, operation, divisible_test, true_target, false_target)
 
 
-def generate_chunks_of_lines(raw_lines: List[Any]) -> Generator[List[Any], None, None]:
-    raw_lines_iterator = iter(raw_lines)
-    while lines := list(takewhile(lambda line: bool(line), raw_lines_iterator)):
-        yield lines
-
-
 def get_monkey_business_level(monkeys: list[Monkey], rounds: int = 20) -> int:
     # I just searched this math property in the solutions :/
     boring_product = 1
@@ -115,6 +113,18 @@ def _get_test_monkeys() -> list[Monkey]:
     return [monkey0, monkey1, monkey2, monkey3]
 
 
+def parse_input(input_path: Path) -> list[Monkey]:
+    return [
+        build_monkey_from_text(chunk.decode().splitlines())
+        for chunk in read_chunks(input_path)
+    ]
+
+
+def solve(input_path: Path) -> int:
+    monkeys = cached_parse(parse_input, input_path)
+    return get_monkey_business_level(monkeys, 10000)
+
+
 def test_build_monkey_from_text():
     monkey = _get_test_monkeys()[0]
     assert monkey.id == 0
@@ -153,15 +163,5 @@ def test_get_monkey_large_business_level():
     assert get_monkey_business_level(monkeys, 10000) == 2713310158
 
 
-def test_generate_chunks_of_lines() -> None:
-    assert list(
-        generate_chunks_of_lines(["a", "b", "", "c", "d", "", "e", "f", "g"])
-    ) == [["a", "b"], ["c", "d"], ["e", "f", "g"]]
-
-
 if __name__ == "__main__":
-    with open((Path(__file__).parent / "input.txt")) as f:
-        raw_lines = [line.rstrip("\n") for line in f]
-    chunks_of_calories = generate_chunks_of_lines(raw_lines)
-    monkeys = [build_monkey_from_text(chunk) for chunk in chunks_of_calories]
-    print(get_monkey_business_level(monkeys, 10000))
+    print(solve(Path(__file__).parent / "input.txt"))